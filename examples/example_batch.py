@@ -42,6 +42,7 @@ def main():
             use_cdp=False,
         ),
         parallel=False,  # Параллельная генерация (если поддерживается)
+        batch_prompts=False,  # Несколько тест-кейсов в одном запросе к LLM
     )
 
     # Статистика
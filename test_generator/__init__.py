@@ -4,8 +4,43 @@
 Основной класс для использования: TestGenerator
 """
 
-from test_generator.core.generator import TestGenerator
+import importlib
+
+# TestGenerator импортирует все компоненты библиотеки, поэтому загружается
+# при первом обращении (PEP 562): импорт отдельных подпакетов его не тянет
+_LAZY = {
+    "TestGenerator": "test_generator.core.generator",
+}
 
 __all__ = ["TestGenerator"]
 __version__ = "0.1.0"
 
+
+def __getattr__(name):
+    """
+    Импортирует атрибут пакета при первом обращении.
+
+    Args:
+        name: Имя атрибута
+
+    Returns:
+        Значение атрибута
+
+    Raises:
+        AttributeError: Если атрибута нет в пакете
+    """
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """
+    Возвращает имена пакета вместе с еще не загруженными атрибутами.
+
+    Returns:
+        Отсортированный список имен
+    """
+    return sorted(set(globals()) | set(__all__))
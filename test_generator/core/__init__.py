@@ -1,7 +1,41 @@
 """Основная логика библиотеки."""
 
-from test_generator.core.generator import TestGenerator
-from test_generator.core.config import Config
+import importlib
+
+# Компоненты импортируются при первом обращении (PEP 562)
+_LAZY = {
+    "TestGenerator": "test_generator.core.generator",
+    "Config": "test_generator.core.config",
+}
 
 __all__ = ["TestGenerator", "Config"]
 
+
+def __getattr__(name):
+    """
+    Импортирует атрибут пакета при первом обращении.
+
+    Args:
+        name: Имя атрибута
+
+    Returns:
+        Значение атрибута
+
+    Raises:
+        AttributeError: Если атрибута нет в пакете
+    """
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """
+    Возвращает имена пакета вместе с еще не загруженными атрибутами.
+
+    Returns:
+        Отсортированный список имен
+    """
+    return sorted(set(globals()) | set(__all__))
@@ -157,6 +157,7 @@ class Config:
             auto_index=repo_config.get("auto_index", False),
             include_patterns=repo_config.get("include_patterns"),
             exclude_patterns=repo_config.get("exclude_patterns"),
+            max_index_bytes=repo_config.get("max_index_bytes", 512 * 1024),
             branch=repo_config.get("branch"),
             commit=repo_config.get("commit"),
         )
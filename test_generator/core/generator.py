@@ -183,73 +183,14 @@ class TestGenerator:
                     additional_context["selectors"] = {}
                 additional_context["selectors"].update(cdp_selectors)
 
-            # Этап 3: Построение промптов
-            self.logger.info("Построение промптов...")
-            # Получение индекса репозитория
-            repository_index = self.get_repository_index()
-            prompts = self.prompt_builder.build_full_prompt(
+            # Этапы 3-9: промпты, генерация через LLM, обработка и сохранение
+            self._generate_prepared_test(
+                result=result,
                 test_case=parsed_test_case,
-                repository_index=repository_index,
+                gen_config=gen_config,
                 additional_context=additional_context,
-                custom_prompts=gen_config.custom_prompts,
-                code_style=gen_config.code_style,
-            )
-
-            # Этап 4: Генерация через LLM
-            self.logger.info("Генерация кода через LLM...")
-            llm_responses = self._generate_with_llm(
-                prompts=prompts,
-                llm_config=gen_config.llm,
-                result=result,
-            )
-
-            # Этап 5: Пост-обработка ответов
-            self.logger.info("Обработка сгенерированного кода...")
-            processed_code = self._post_process_responses(llm_responses, parsed_test_case)
-
-            # Этап 6: Генерация файлов
-            self.logger.info("Создание файлов...")
-            generated_files = self._generate_files(processed_code, parsed_test_case, gen_config)
-
-            # Этап 7: Валидация
-            if gen_config.validate_code:
-                self.logger.info("Валидация кода...")
-                validation_report = self._validate_code(generated_files, parsed_test_case)
-                result.validation_report = validation_report
-
-                if not validation_report.valid:
-                    result.status = GenerationStatus.VALIDATION_ERROR
-                    result.errors.extend([issue.message for issue in validation_report.errors])
-
-            # Этап 8: Форматирование
-            if gen_config.format_code:
-                self.logger.info("Форматирование кода...")
-                generated_files = self._format_files(generated_files, gen_config.format_style)
-
-            # Этап 9: Сохранение
-            self.logger.info("Сохранение файлов...")
-            output_dir = output_path or self.config.get_output_path()
-            output_dir = Path(output_dir)
-
-            # Создание структуры директорий
-            self.directory_builder.build_structure(output_dir, generated_files)
-
-            # Сохранение файлов
-            saved_dir = self.file_manager.save_files(
-                files=generated_files,
-                output_dir=output_dir,
-                overwrite=gen_config.overwrite_existing,
-            )
-
-            # Успешное завершение
-            result.status = GenerationStatus.SUCCESS
-            result.success = True
-            result.generated_files = generated_files
-            result.output_directory = saved_dir
-
-            self.logger.info(
-                f"Генерация завершена успешно: {len(generated_files)} файлов, "
-                f"время: {(time.time() - start_time) * 1000:.2f}мс"
+                output_path=output_path,
+                start_time=start_time,
             )
 
         except Exception as e:
@@ -261,6 +202,126 @@ class TestGenerator:
 
         return result
 
+    def _generate_prepared_test(
+        self,
+        result: GenerationResult,
+        test_case: TestCase,
+        gen_config: GenerationConfig,
+        additional_context: Optional[Dict[str, Any]],
+        output_path: Optional[Union[str, Path]],
+        start_time: float,
+    ) -> None:
+        """
+        Генерирует автотест для разобранного и нормализованного тест-кейса
+        отдельным запросом к LLM.
+
+        Args:
+            result: Результат генерации для заполнения
+            test_case: Тест-кейс
+            gen_config: Конфигурация генерации
+            additional_context: Дополнительный контекст
+            output_path: Путь для сохранения файлов
+            start_time: Время начала генерации
+        """
+        # Этап 3: Построение промптов
+        self.logger.info("Построение промптов...")
+        # Получение индекса репозитория
+        repository_index = self.get_repository_index()
+        prompts = self.prompt_builder.build_full_prompt(
+            test_case=test_case,
+            repository_index=repository_index,
+            additional_context=additional_context,
+            custom_prompts=gen_config.custom_prompts,
+            code_style=gen_config.code_style,
+        )
+
+        # Этап 4: Генерация через LLM
+        self.logger.info("Генерация кода через LLM...")
+        llm_responses = self._generate_with_llm(
+            prompts=prompts,
+            llm_config=gen_config.llm,
+            result=result,
+        )
+
+        # Этапы 5-9: обработка, валидация и сохранение
+        self._finalize_result(
+            result=result,
+            llm_responses=llm_responses,
+            test_case=test_case,
+            gen_config=gen_config,
+            output_path=output_path,
+            start_time=start_time,
+        )
+
+    def _finalize_result(
+        self,
+        result: GenerationResult,
+        llm_responses: Dict[str, Any],
+        test_case: TestCase,
+        gen_config: GenerationConfig,
+        output_path: Optional[Union[str, Path]],
+        start_time: float,
+    ) -> None:
+        """
+        Обрабатывает ответ LLM, валидирует и сохраняет файлы в результат.
+
+        Args:
+            result: Результат генерации для заполнения
+            llm_responses: Ответы от LLM
+            test_case: Тест-кейс
+            gen_config: Конфигурация генерации
+            output_path: Путь для сохранения файлов
+            start_time: Время начала генерации
+        """
+        # Этап 5: Пост-обработка ответов
+        self.logger.info("Обработка сгенерированного кода...")
+        processed_code = self._post_process_responses(llm_responses, test_case)
+
+        # Этап 6: Генерация файлов
+        self.logger.info("Создание файлов...")
+        generated_files = self._generate_files(processed_code, test_case, gen_config)
+
+        # Этап 7: Валидация
+        if gen_config.validate_code:
+            self.logger.info("Валидация кода...")
+            validation_report = self._validate_code(generated_files, test_case)
+            result.validation_report = validation_report
+
+            if not validation_report.valid:
+                result.status = GenerationStatus.VALIDATION_ERROR
+                result.errors.extend([issue.message for issue in validation_report.errors])
+
+        # Этап 8: Форматирование
+        if gen_config.format_code:
+            self.logger.info("Форматирование кода...")
+            generated_files = self._format_files(generated_files, gen_config.format_style)
+
+        # Этап 9: Сохранение
+        self.logger.info("Сохранение файлов...")
+        output_dir = output_path or self.config.get_output_path()
+        output_dir = Path(output_dir)
+
+        # Создание структуры директорий
+        self.directory_builder.build_structure(output_dir, generated_files)
+
+        # Сохранение файлов
+        saved_dir = self.file_manager.save_files(
+            files=generated_files,
+            output_dir=output_dir,
+            overwrite=gen_config.overwrite_existing,
+        )
+
+        # Успешное завершение
+        result.status = GenerationStatus.SUCCESS
+        result.success = True
+        result.generated_files = generated_files
+        result.output_directory = saved_dir
+
+        self.logger.info(
+            f"Генерация завершена успешно: {len(generated_files)} файлов, "
+            f"время: {(time.time() - start_time) * 1000:.2f}мс"
+        )
+
     def _generate_with_llm(
         self,
         prompts: Dict[str, str],
@@ -405,7 +466,6 @@ class TestGenerator:
                         path=file_path,
                         content=full_page_code,
                         file_type="page_object",
-                        size_bytes=len(full_page_code.encode("utf-8")),
                     )
                 )
             
@@ -434,7 +494,6 @@ class TestGenerator:
                         path=file_path,
                         content=full_test_code,
                         file_type="test",
-                        size_bytes=len(full_test_code.encode("utf-8")),
                     )
                 )
 
@@ -732,7 +791,6 @@ class TestGenerator:
                     path=file.path,
                     content=formatted_content,
                     file_type=file.file_type,
-                    size_bytes=len(formatted_content.encode("utf-8")),
                 )
             )
 
@@ -791,6 +849,7 @@ class TestGenerator:
         repository_context: Optional[RepositoryContext] = None,
         additional_context: Optional[Dict[str, Any]] = None,
         parallel: bool = False,
+        batch_prompts: bool = False,
     ) -> List[GenerationResult]:
         """
         Генерирует несколько автотестов пакетно.
@@ -802,10 +861,24 @@ class TestGenerator:
             repository_context: Контекст репозитория
             additional_context: Дополнительный контекст
             parallel: Использовать параллельную генерацию (если поддерживается)
+            batch_prompts: Объединять несколько тест-кейсов в один запрос к LLM
+                           с общим системным и контекстным промптом
 
         Returns:
             Список результатов генерации
         """
+        gen_config = generation_config or self.config.get_generation_config()
+
+        # Селекторы CDP индивидуальны для каждого тест-кейса, поэтому общий
+        # контекст пакета для них не подходит
+        if batch_prompts and not gen_config.use_cdp:
+            return self._generate_tests_with_batch_prompts(
+                test_cases=test_cases,
+                output_path=output_path,
+                gen_config=gen_config,
+                additional_context=additional_context,
+            )
+
         results = []
 
         for test_case in test_cases:
@@ -820,6 +893,123 @@ class TestGenerator:
 
         return results
 
+    def _generate_tests_with_batch_prompts(
+        self,
+        test_cases: List[Union[TestCase, str, Path, Dict[str, Any]]],
+        output_path: Optional[Union[str, Path]],
+        gen_config: GenerationConfig,
+        additional_context: Optional[Dict[str, Any]],
+    ) -> List[GenerationResult]:
+        """
+        Генерирует автотесты, отправляя в LLM несколько тест-кейсов за запрос.
+
+        Тест-кейсы, для которых в ответе LLM нет блока ответа или он пуст,
+        генерируются отдельными запросами.
+
+        Args:
+            test_cases: Список тест-кейсов
+            output_path: Базовый путь для сохранения
+            gen_config: Настройки генерации
+            additional_context: Дополнительный контекст
+
+        Returns:
+            Список результатов генерации в порядке входных тест-кейсов
+        """
+        start_time = time.time()
+        results = []
+        pending = []
+
+        # Парсинг и валидация всех тест-кейсов, затем общая нормализация
+        for test_case in test_cases:
+            result = GenerationResult(
+                status=GenerationStatus.FAILED,
+                success=False,
+                test_case_id="",
+                test_case_name="",
+                generation_time_ms=0.0,
+            )
+            results.append(result)
+            try:
+                parsed_test_case = self.parser.parse(test_case)
+                result.test_case_id = parsed_test_case.id
+                result.test_case_name = parsed_test_case.name
+                self.validator.validate(parsed_test_case)
+                pending.append((result, parsed_test_case))
+            except Exception as e:
+                result.errors.append(str(e))
+                self.logger.error(f"Ошибка подготовки тест-кейса: {e}")
+
+        self.normalizer.normalize_many([tc for _, tc in pending])
+
+        repository_index = self.get_repository_index()
+        batch_size = self.prompt_builder.select_batch_size(
+            [tc for _, tc in pending], gen_config.llm.max_tokens
+        )
+        self.logger.info(f"Пакетная генерация: {len(pending)} тест-кейсов, размер пакета {batch_size}")
+
+        for offset in range(0, len(pending), batch_size):
+            chunk = pending[offset:offset + batch_size]
+            chunk_start = time.time()
+
+            try:
+                prompts = self.prompt_builder.build_batch_prompt(
+                    test_cases=[tc for _, tc in chunk],
+                    repository_index=repository_index,
+                    additional_context=additional_context,
+                    custom_prompts=gen_config.custom_prompts,
+                    code_style=gen_config.code_style,
+                )
+                # Метаданные запроса записываются в результат первого тест-кейса
+                # и копируются в остальные результаты пакета
+                llm_responses = self._generate_with_llm(
+                    prompts=prompts,
+                    llm_config=gen_config.llm,
+                    result=chunk[0][0],
+                )
+                answers = self.prompt_builder.split_batch_response(llm_responses["code"])
+            except Exception as e:
+                for result, _ in chunk:
+                    result.errors.append(str(e))
+                    result.generation_time_ms = (time.time() - chunk_start) * 1000
+                self.logger.error(f"Ошибка пакетной генерации: {e}", exc_info=True)
+                continue
+
+            batch_requests = list(chunk[0][0].llm_requests)
+            for i, (result, parsed_test_case) in enumerate(chunk, 1):
+                if i > 1:
+                    result.llm_requests.extend(batch_requests)
+                try:
+                    if answers.get(i):
+                        self._finalize_result(
+                            result=result,
+                            llm_responses={"code": answers[i]},
+                            test_case=parsed_test_case,
+                            gen_config=gen_config,
+                            output_path=output_path,
+                            start_time=chunk_start,
+                        )
+                    else:
+                        self.logger.warning(
+                            f"В ответе LLM нет блока ANSWER [{i}], "
+                            f"тест-кейс {parsed_test_case.id} генерируется отдельным запросом"
+                        )
+                        self._generate_prepared_test(
+                            result=result,
+                            test_case=parsed_test_case,
+                            gen_config=gen_config,
+                            additional_context=additional_context,
+                            output_path=output_path,
+                            start_time=chunk_start,
+                        )
+                except Exception as e:
+                    result.errors.append(str(e))
+                    self.logger.error(f"Ошибка генерации: {e}", exc_info=True)
+                finally:
+                    result.generation_time_ms = (time.time() - chunk_start) * 1000
+
+        self.logger.info(f"Пакетная генерация завершена за {(time.time() - start_time) * 1000:.2f}мс")
+        return results
+
     def index_repository(
         self,
         repository_url: Optional[str] = None,
@@ -872,9 +1062,19 @@ class TestGenerator:
             connector.connect()
 
             try:
+                # Предыдущий индекс: неизмененные файлы из него не перечитываются
+                previous_index = None
+                if incremental:
+                    previous_index = self._find_previous_index(context)
+
                 # Индексация
                 indexer = RepositoryIndexer(connector)
-                index = indexer.index(context, force=force, incremental=incremental)
+                index = indexer.index(
+                    context,
+                    force=force,
+                    incremental=incremental,
+                    previous_index=previous_index,
+                )
 
                 # Извлечение паттернов
                 pattern_extractor = PatternExtractor()
@@ -891,6 +1091,7 @@ class TestGenerator:
                     IndexStorage.save(index, context.index_path)
 
                 self._repository_index = index
+                self.prompt_builder.invalidate_context_cache()
                 self.logger.info("Индексация завершена успешно")
 
                 return index
@@ -904,6 +1105,44 @@ class TestGenerator:
                 raise
             raise RepositoryIndexError(f"Ошибка индексации: {e}") from e
 
+    def _find_previous_index(self, context: RepositoryContext) -> Optional[RepositoryIndex]:
+        """
+        Находит предыдущий индекс того же репозитория для инкрементального обновления.
+
+        Args:
+            context: Контекст индексируемого репозитория
+
+        Returns:
+            Индекс из памяти или из файла, если он относится к этому репозиторию, иначе None
+        """
+        index = self._repository_index
+        if index is not None and self._index_belongs_to(index, context):
+            return index
+
+        if context.index_path:
+            index = IndexStorage.load(context.index_path)
+            if index is not None and self._index_belongs_to(index, context):
+                return index
+        return None
+
+    @staticmethod
+    def _index_belongs_to(index: RepositoryIndex, context: RepositoryContext) -> bool:
+        """
+        Проверяет, что индекс построен для репозитория из контекста.
+
+        Args:
+            index: Индекс репозитория
+            context: Контекст репозитория
+
+        Returns:
+            True если совпадает URL или локальный путь репозитория
+        """
+        if context.repository_url:
+            return index.repository_url == context.repository_url
+        if context.repository_path and index.repository_path:
+            return Path(context.repository_path).resolve() == Path(index.repository_path).resolve()
+        return False
+
     def update_repository_index(self, force: bool = False) -> RepositoryIndex:
         """
         Обновляет существующий индекс репозитория.
@@ -985,7 +1224,6 @@ class TestGenerator:
             path=Path("temp.py"),
             content=code,
             file_type="test",
-            size_bytes=len(code.encode("utf-8")),
         )
 
         default_test_case = TestCase(
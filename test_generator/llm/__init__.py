@@ -2,7 +2,7 @@
 
 from test_generator.llm.base import LLMProvider
 from test_generator.llm.ollama_provider import OllamaProvider
-from test_generator.llm.prompt_builder import PromptBuilder
+from test_generator.llm.prompt_builder import PromptBuilder, BoundPromptBuilder
 
-__all__ = ["LLMProvider", "OllamaProvider", "PromptBuilder"]
+__all__ = ["LLMProvider", "OllamaProvider", "PromptBuilder", "BoundPromptBuilder"]
 
@@ -1,6 +1,9 @@
 """Построитель промптов для LLM."""
 
-from typing import Optional, Dict, Any, List
+import io
+import re
+import weakref
+from typing import Optional, Dict, Any, List, Tuple
 
 from test_generator.models import TestCase, CodeStyle
 from test_generator.repository.models import RepositoryIndex
@@ -8,26 +11,20 @@ from test_generator.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Максимальный размер пакета: при большем числе задач в одном запросе
+# качество ответов LLM заметно падает
+MAX_BATCH_SIZE = 8
 
-class PromptBuilder:
-    """Построитель промптов для LLM."""
+# Оценка размера ответа на одну задачу (Page Object + тестовый класс)
+_MIN_ANSWER_TOKENS = 1000
+_CHARS_PER_TOKEN = 4
 
-    def build_system_prompt(
-        self,
-        templates: Optional[Dict[str, Any]] = None,
-        code_style: CodeStyle = CodeStyle.STANDARD,
-    ) -> str:
-        """
-        Строит системный промпт.
+_BATCH_ANSWER_RE = re.compile(r"^[ \t#]*=== ANSWER \[(\d+)\] ===[ \t]*$", re.MULTILINE)
 
-        Args:
-            templates: Шаблоны из репозитория
-            code_style: Стиль кода
+# Ключевые слова, указывающие на упоминание страницы в описании шага
+_PAGE_KEYWORDS_RE = re.compile(r"страниц|page", re.IGNORECASE)
 
-        Returns:
-            Системный промпт
-        """
-        prompt = """Ты эксперт по автоматизации тестирования на Python.
+_BASE_SYSTEM_PROMPT = """Ты эксперт по автоматизации тестирования на Python.
 
 Твоя задача - генерировать качественные автотесты UI с использованием:
 - Playwright для взаимодействия с браузером
@@ -45,12 +42,91 @@ class PromptBuilder:
 7. Используй осмысленные имена переменных и методов
 """
 
-        if code_style == CodeStyle.VERBOSE:
-            prompt += "\n8. Добавляй подробные комментарии и docstrings\n"
-        elif code_style == CodeStyle.COMPACT:
-            prompt += "\n8. Пиши компактный код без избыточных комментариев\n"
+# Системные промпты не зависят от тест-кейса, поэтому собираются один раз
+_SYSTEM_PROMPTS: Dict[CodeStyle, str] = {
+    CodeStyle.STANDARD: _BASE_SYSTEM_PROMPT,
+    CodeStyle.VERBOSE: _BASE_SYSTEM_PROMPT + "\n8. Добавляй подробные комментарии и docstrings\n",
+    CodeStyle.COMPACT: _BASE_SYSTEM_PROMPT + "\n8. Пиши компактный код без избыточных комментариев\n",
+}
 
-        return prompt
+# Общие требования к ответу, от тест-кейса зависит только имя тестового класса
+_TASK_FOOTER_TEMPLATE = """
+
+КРИТИЧЕСКИ ВАЖНО: Строго следуй шаблонам из репозитория проекта!
+
+1. PAGE OBJECT КЛАСС:
+   - ИМПОРТЫ (в таком порядке):
+     * import os
+     * import allure
+     * from dotenv import load_dotenv
+     * from gpn_qa_utils.ui.page_factory.* (Button, Input, Link, Text и т.д.)
+     * from gpn_qa_utils.ui.pages.base import BasePage
+     * from playwright.sync_api import Page
+   - В начале класса: load_dotenv()
+   - super().__init__(page, url=os.getenv("AUTOTEST_BASE_URL")) или super().__init__(page)
+   - Элементы определяй как self.element_name = Component(page, selector="...", allure_name="...")
+   - Методы используй allure.step для действий
+
+2. ТЕСТОВЫЙ КЛАСС:
+   - Тесты должны быть в КЛАССЕ, а не как отдельные функции!
+   - Имя класса: Test* (например, Test{test_class_name})
+   - ИМПОРТЫ (в таком порядке):
+     * import os
+     * import allure
+     * import pytest
+     * from src.ui.pages.* import PageObjectClass (НЕ из pages.*!)
+   - Класс должен иметь декораторы: @allure.epic("..."), @allure.feature("...")
+   - Каждый тест должен иметь @allure.title("...")
+   - Тесты принимают browser: Page или фикстуры страниц (main_page, login_page и т.д.)
+   - НЕ используй прямые вызовы Playwright (expect, page.locator) - только методы Page Object!
+   - Используй методы Page Object для всех действий и проверок
+
+Формат ответа:
+```python
+# === PAGE OBJECT ===
+[код Page Object класса строго по шаблону]
+
+# === TEST CLASS ===
+[код тестового класса строго по шаблону]
+```
+
+ТРЕБОВАНИЯ:
+1. Строго следуй шаблонам из репозитория - они показаны выше
+2. Page Object и тестовый класс должны быть в ОДНОМ ответе, но четко разделены
+3. Используй ТОЛЬКО компоненты из gpn_qa_utils.ui.page_factory
+4. НЕ используй прямые вызовы Playwright в тестах - только методы Page Object
+5. Тесты должны быть в классе, а не как отдельные функции
+6. Используй правильные импорты из src.ui.pages.*
+7. Каждый тест должен иметь @allure.title
+8. Класс тестов должен иметь @allure.epic и @allure.feature
+"""
+
+
+class PromptBuilder:
+    """Построитель промптов для LLM."""
+
+    def __init__(self) -> None:
+        """Инициализация построителя промптов."""
+        # Контекст репозитория неизменен в рамках генерации: кэшируется для
+        # последнего индекса; слабая ссылка не удерживает индекс в памяти
+        self._ctx_cache: Optional[Tuple["weakref.ref[RepositoryIndex]", str]] = None
+
+    def build_system_prompt(
+        self,
+        templates: Optional[Dict[str, Any]] = None,
+        code_style: CodeStyle = CodeStyle.STANDARD,
+    ) -> str:
+        """
+        Строит системный промпт.
+
+        Args:
+            templates: Шаблоны из репозитория
+            code_style: Стиль кода
+
+        Returns:
+            Системный промпт
+        """
+        return _SYSTEM_PROMPTS.get(code_style, _BASE_SYSTEM_PROMPT)
 
     def build_context_prompt(
         self,
@@ -71,55 +147,7 @@ class PromptBuilder:
 
         # Информация из репозитория
         if repository_index:
-            prompt_parts.append("Информация о структуре проекта:")
-
-            # Структура проекта
-            structure = repository_index.structure
-            prompt_parts.append(f"- Тестовые директории: {len(structure.test_directories)}")
-            prompt_parts.append(f"- Page Object директории: {len(structure.page_object_directories)}")
-
-            # Паттерны именования
-            naming = repository_index.naming_patterns
-            prompt_parts.append(f"\nПаттерны именования:")
-            prompt_parts.append(f"- Файлы: {naming.file_naming}")
-            prompt_parts.append(f"- Классы: {naming.class_naming}")
-            prompt_parts.append(f"- Функции: {naming.function_naming}")
-            prompt_parts.append(f"- Префикс тестов: {naming.test_prefix}")
-            prompt_parts.append(f"- Суффикс Page Objects: {naming.page_suffix}")
-
-            # Паттерны кода
-            code_patterns = repository_index.code_patterns
-            prompt_parts.append(f"\nПаттерны кода:")
-            prompt_parts.append(f"- Используется qautils: {code_patterns.uses_qautils}")
-            prompt_parts.append(f"- Используется Allure: {code_patterns.uses_allure}")
-            if code_patterns.base_page_class:
-                prompt_parts.append(f"- Базовый класс Page: {code_patterns.base_page_class}")
-            if code_patterns.browser_launcher:
-                prompt_parts.append(f"- Browser Launcher: {code_patterns.browser_launcher}")
-
-            # Примеры кода - полные шаблоны
-            if repository_index.templates.page_object_template:
-                prompt_parts.append("\n=== ШАБЛОН PAGE OBJECT КЛАССА (СТРОГО СЛЕДУЙ ЭТОМУ ФОРМАТУ) ===")
-                prompt_parts.append("```python")
-                prompt_parts.append(repository_index.templates.page_object_template)
-                prompt_parts.append("```")
-            
-            if repository_index.templates.test_template:
-                prompt_parts.append("\n=== ШАБЛОН ТЕСТОВОГО КЛАССА (СТРОГО СЛЕДУЙ ЭТОМУ ФОРМАТУ) ===")
-                prompt_parts.append("```python")
-                prompt_parts.append(repository_index.templates.test_template)
-                prompt_parts.append("```")
-            
-            # Общие фрагменты кода
-            if repository_index.templates.common_code_snippets:
-                prompt_parts.append("\n=== ДОПОЛНИТЕЛЬНЫЕ ПРИМЕРЫ КОДА ===")
-                for i, snippet in enumerate(repository_index.templates.common_code_snippets[:2], 1):
-                    prompt_parts.append(f"\nПример {i}:")
-                    prompt_parts.append("```python")
-                    # Берем первые 80 строк каждого примера
-                    lines = snippet.split("\n")[:80]
-                    prompt_parts.extend(lines)
-                    prompt_parts.append("```")
+            prompt_parts.append(self._get_repository_context(repository_index))
 
         # Дополнительный контекст
         if additional_context:
@@ -141,6 +169,94 @@ class PromptBuilder:
 
         return "\n".join(prompt_parts)
 
+    def invalidate_context_cache(self) -> None:
+        """Сбрасывает кэш контекста репозитория (после переиндексации)."""
+        self._ctx_cache = None
+
+    def _get_repository_context(self, repository_index: RepositoryIndex) -> str:
+        """
+        Возвращает контекст репозитория, используя кэш.
+
+        Args:
+            repository_index: Индекс репозитория
+
+        Returns:
+            Часть контекстного промпта с информацией о репозитории
+        """
+        cached = self._ctx_cache
+        if cached is not None and cached[0]() is repository_index:
+            return cached[1]
+
+        prompt = self._build_repository_context(repository_index)
+        self._ctx_cache = (weakref.ref(repository_index), prompt)
+        return prompt
+
+    def _build_repository_context(self, repository_index: RepositoryIndex) -> str:
+        """
+        Строит часть контекстного промпта с информацией о репозитории.
+
+        Args:
+            repository_index: Индекс репозитория
+
+        Returns:
+            Контекст репозитория
+        """
+        buf = io.StringIO()
+        w = buf.write
+        w("Информация о структуре проекта:\n")
+
+        # Структура проекта
+        structure = repository_index.structure
+        w(f"- Тестовые директории: {len(structure.test_directories)}\n")
+        w(f"- Page Object директории: {len(structure.page_object_directories)}\n")
+
+        # Паттерны именования
+        naming = repository_index.naming_patterns
+        w("\nПаттерны именования:\n")
+        w(f"- Файлы: {naming.file_naming}\n")
+        w(f"- Классы: {naming.class_naming}\n")
+        w(f"- Функции: {naming.function_naming}\n")
+        w(f"- Префикс тестов: {naming.test_prefix}\n")
+        w(f"- Суффикс Page Objects: {naming.page_suffix}\n")
+
+        # Паттерны кода
+        code_patterns = repository_index.code_patterns
+        w("\nПаттерны кода:\n")
+        w(f"- Используется qautils: {code_patterns.uses_qautils}\n")
+        w(f"- Используется Allure: {code_patterns.uses_allure}\n")
+        if code_patterns.base_page_class:
+            w(f"- Базовый класс Page: {code_patterns.base_page_class}\n")
+        if code_patterns.browser_launcher:
+            w(f"- Browser Launcher: {code_patterns.browser_launcher}\n")
+
+        # Примеры кода - полные шаблоны
+        if repository_index.templates.page_object_template:
+            w("\n=== ШАБЛОН PAGE OBJECT КЛАССА (СТРОГО СЛЕДУЙ ЭТОМУ ФОРМАТУ) ===\n")
+            w("```python\n")
+            w(repository_index.templates.page_object_template)
+            w("\n```\n")
+
+        if repository_index.templates.test_template:
+            w("\n=== ШАБЛОН ТЕСТОВОГО КЛАССА (СТРОГО СЛЕДУЙ ЭТОМУ ФОРМАТУ) ===\n")
+            w("```python\n")
+            w(repository_index.templates.test_template)
+            w("\n```\n")
+
+        # Общие фрагменты кода
+        if repository_index.templates.common_code_snippets:
+            w("\n=== ДОПОЛНИТЕЛЬНЫЕ ПРИМЕРЫ КОДА ===\n")
+            for i, snippet in enumerate(repository_index.templates.common_code_snippets[:2], 1):
+                w(f"\nПример {i}:\n")
+                w("```python\n")
+                # Берем первые 80 строк каждого примера (разбиение останавливается после 80-й)
+                lines = snippet.split("\n", 80)[:80]
+                w("\n".join(lines))
+                w("\n")
+                w("```\n")
+
+        # Последний перевод строки не входит в промпт
+        return buf.getvalue()[:-1]
+
     def build_task_prompt(
         self,
         test_case: TestCase,
@@ -156,7 +272,7 @@ class PromptBuilder:
         Returns:
             Задачный промпт
         """
-        prompt = f"""Сгенерируй автотест на основе следующего тест-кейса:
+        parts: List[str] = [f"""Сгенерируй автотест на основе следующего тест-кейса:
 
 ID: {test_case.id}
 Название: {test_case.name}
@@ -169,70 +285,22 @@ Feature: {test_case.feature or 'Не указан'}
 Story: {test_case.story or 'Не указан'}
 
 Шаги теста:
-"""
+"""]
 
         for i, step in enumerate(test_case.steps, 1):
-            prompt += f"""
+            parts.append(f"""
 Шаг {i} ({step.id}): {step.name}
 Описание: {step.description}
 Ожидаемый результат: {step.expected_result}
-"""
+""")
 
         if page_objects_needed:
-            prompt += f"\nНеобходимые Page Objects: {', '.join(page_objects_needed)}"
+            parts.append(f"\nНеобходимые Page Objects: {', '.join(page_objects_needed)}")
 
-        prompt += f"""
+        class_suffix = test_case.id.replace("_", "")
+        parts.append(_TASK_FOOTER_TEMPLATE.format(test_class_name=class_suffix))
 
-КРИТИЧЕСКИ ВАЖНО: Строго следуй шаблонам из репозитория проекта!
-
-1. PAGE OBJECT КЛАСС:
-   - ИМПОРТЫ (в таком порядке):
-     * import os
-     * import allure
-     * from dotenv import load_dotenv
-     * from gpn_qa_utils.ui.page_factory.* (Button, Input, Link, Text и т.д.)
-     * from gpn_qa_utils.ui.pages.base import BasePage
-     * from playwright.sync_api import Page
-   - В начале класса: load_dotenv()
-   - super().__init__(page, url=os.getenv("AUTOTEST_BASE_URL")) или super().__init__(page)
-   - Элементы определяй как self.element_name = Component(page, selector="...", allure_name="...")
-   - Методы используй allure.step для действий
-
-2. ТЕСТОВЫЙ КЛАСС:
-   - Тесты должны быть в КЛАССЕ, а не как отдельные функции!
-   - Имя класса: Test* (например, Test{test_case.id.replace('_', '')})
-   - ИМПОРТЫ (в таком порядке):
-     * import os
-     * import allure
-     * import pytest
-     * from src.ui.pages.* import PageObjectClass (НЕ из pages.*!)
-   - Класс должен иметь декораторы: @allure.epic("..."), @allure.feature("...")
-   - Каждый тест должен иметь @allure.title("...")
-   - Тесты принимают browser: Page или фикстуры страниц (main_page, login_page и т.д.)
-   - НЕ используй прямые вызовы Playwright (expect, page.locator) - только методы Page Object!
-   - Используй методы Page Object для всех действий и проверок
-
-Формат ответа:
-```python
-# === PAGE OBJECT ===
-[код Page Object класса строго по шаблону]
-
-# === TEST CLASS ===
-[код тестового класса строго по шаблону]
-```
-
-ТРЕБОВАНИЯ:
-1. Строго следуй шаблонам из репозитория - они показаны выше
-2. Page Object и тестовый класс должны быть в ОДНОМ ответе, но четко разделены
-3. Используй ТОЛЬКО компоненты из gpn_qa_utils.ui.page_factory
-4. НЕ используй прямые вызовы Playwright в тестах - только методы Page Object
-5. Тесты должны быть в классе, а не как отдельные функции
-6. Используй правильные импорты из src.ui.pages.*
-7. Каждый тест должен иметь @allure.title
-8. Класс тестов должен иметь @allure.epic и @allure.feature
-"""
-
-        return prompt
+        return "".join(parts)
 
     def build_full_prompt(
         self,
@@ -255,6 +323,31 @@ Story: {test_case.story or 'Не указан'}
         Returns:
             Словарь с ключами: system, context, task
         """
+        bound = self.bind(repository_index, additional_context, code_style, custom_prompts)
+        return bound.for_test_case(test_case)
+
+    def bind(
+        self,
+        repository_index: Optional[Any] = None,
+        additional_context: Optional[Dict[str, Any]] = None,
+        code_style: CodeStyle = CodeStyle.STANDARD,
+        custom_prompts: Optional[Dict[str, str]] = None,
+    ) -> "BoundPromptBuilder":
+        """
+        Фиксирует общие для всех тест-кейсов параметры промпта.
+
+        Системный и контекстный промпты строятся один раз, далее для каждого
+        тест-кейса строится только задачный промпт.
+
+        Args:
+            repository_index: Индекс репозитория
+            additional_context: Дополнительный контекст
+            code_style: Стиль кода
+            custom_prompts: Кастомные промпты
+
+        Returns:
+            Построитель промптов с зафиксированным контекстом
+        """
         # Использование кастомных промптов если есть
         if custom_prompts:
             system_prompt = custom_prompts.get("system") or self.build_system_prompt(
@@ -265,16 +358,100 @@ Story: {test_case.story or 'Не указан'}
 
         context_prompt = self.build_context_prompt(repository_index, additional_context)
 
-        # Определение необходимых Page Objects
-        page_objects_needed = self._extract_page_objects(test_case)
-        task_prompt = self.build_task_prompt(test_case, page_objects_needed)
+        return BoundPromptBuilder(self, system_prompt, context_prompt)
+
+    def build_batch_prompt(
+        self,
+        test_cases: List[TestCase],
+        repository_index: Optional[Any] = None,
+        additional_context: Optional[Dict[str, Any]] = None,
+        custom_prompts: Optional[Dict[str, str]] = None,
+        code_style: CodeStyle = CodeStyle.STANDARD,
+    ) -> Dict[str, str]:
+        """
+        Строит пакетный промпт для нескольких тест-кейсов.
+
+        Системный и контекстный промпты формируются один раз и разделяются
+        всеми задачами пакета. Каждая задача помечается индексом [i],
+        ответ LLM разбирается через split_batch_response.
+
+        Args:
+            test_cases: Тест-кейсы пакета
+            repository_index: Индекс репозитория
+            additional_context: Дополнительный контекст
+            custom_prompts: Кастомные промпты
+            code_style: Стиль кода
+
+        Returns:
+            Словарь с ключами: system, context, task
+        """
+        bound = self.bind(repository_index, additional_context, code_style, custom_prompts)
+
+        task_parts = [
+            f"Ниже {len(test_cases)} независимых задач, каждая помечена как === TASK [i] ===.\n"
+            "Выполни каждую задачу отдельно. Ответ на задачу i начинай с отдельной строки\n"
+            "=== ANSWER [i] ===\n"
+            "и размещай после неё полный ответ в формате, указанном в задаче.\n"
+            "Не пропускай задачи и не объединяй ответы."
+        ]
+        for i, test_case in enumerate(test_cases, 1):
+            task_parts.append(f"=== TASK [{i}] ===\n" + bound.build_task(test_case))
 
         return {
-            "system": system_prompt,
-            "context": context_prompt,
-            "task": task_prompt,
+            "system": bound.system,
+            "context": bound.context,
+            "task": "\n\n".join(task_parts),
         }
 
+    @staticmethod
+    def split_batch_response(text: str) -> Dict[int, str]:
+        """
+        Разбирает ответ LLM на пакетный промпт.
+
+        Блоки с повторяющимся индексом отбрасываются: неизвестно, какой
+        из них относится к задаче.
+
+        Args:
+            text: Ответ LLM с блоками === ANSWER [i] ===
+
+        Returns:
+            Словарь {индекс задачи: ответ}
+        """
+        answers = {}
+        duplicates = set()
+        matches = list(_BATCH_ANSWER_RE.finditer(text))
+        for current, following in zip(matches, matches[1:] + [None]):
+            end = following.start() if following else len(text)
+            index = int(current.group(1))
+            if index in answers:
+                duplicates.add(index)
+            answers[index] = text[current.end():end].strip()
+        for index in duplicates:
+            del answers[index]
+        return answers
+
+    def select_batch_size(self, test_cases: List[TestCase], max_tokens: int) -> int:
+        """
+        Подбирает размер пакета под лимит токенов ответа.
+
+        Args:
+            test_cases: Тест-кейсы для генерации
+            max_tokens: Максимум токенов ответа LLM
+
+        Returns:
+            Количество тест-кейсов в одном запросе (от 1 до MAX_BATCH_SIZE)
+        """
+        if not test_cases:
+            return 1
+
+        # Размер ответа оцениваем по самому длинному промпту задачи
+        longest_task = max(
+            len(self.build_task_prompt(tc, self._extract_page_objects(tc))) for tc in test_cases
+        )
+        answer_tokens = max(_MIN_ANSWER_TOKENS, longest_task // _CHARS_PER_TOKEN)
+
+        return max(1, min(MAX_BATCH_SIZE, len(test_cases), max_tokens // answer_tokens))
+
     def _extract_page_objects(self, test_case: TestCase) -> List[str]:
         """
         Извлекает необходимые Page Objects из тест-кейса.
@@ -289,10 +466,55 @@ Story: {test_case.story or 'Не указан'}
         # Простая эвристика: извлечение из описаний шагов
         for step in test_case.steps:
             # Можно добавить более сложную логику анализа
-            if "страниц" in step.description.lower() or "page" in step.description.lower():
+            if _PAGE_KEYWORDS_RE.search(step.description):
                 # Попытка извлечь название страницы
                 # Это упрощенная версия, в реальности нужен более сложный анализ
                 pass
 
         return page_objects
 
+
+class BoundPromptBuilder:
+    """Построитель промптов с зафиксированными системным и контекстным промптами."""
+
+    def __init__(self, builder: PromptBuilder, system: str, context: str):
+        """
+        Инициализация построителя.
+
+        Args:
+            builder: Исходный построитель промптов
+            system: Системный промпт
+            context: Контекстный промпт
+        """
+        self.system = system
+        self.context = context
+        self._extract_page_objects = builder._extract_page_objects
+        self._build_task_prompt = builder.build_task_prompt
+
+    def build_task(self, test_case: TestCase) -> str:
+        """
+        Строит задачный промпт для тест-кейса.
+
+        Args:
+            test_case: Тест-кейс
+
+        Returns:
+            Задачный промпт
+        """
+        return self._build_task_prompt(test_case, self._extract_page_objects(test_case))
+
+    def for_test_case(self, test_case: TestCase) -> Dict[str, str]:
+        """
+        Строит полный промпт для тест-кейса.
+
+        Args:
+            test_case: Тест-кейс
+
+        Returns:
+            Словарь с ключами: system, context, task
+        """
+        return {
+            "system": self.system,
+            "context": self.context,
+            "task": self.build_task(test_case),
+        }
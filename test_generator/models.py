@@ -1,11 +1,12 @@
 """Модели данных библиотеки."""
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import List, Optional, Dict, Any, Union
 from enum import Enum
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-import json
 
 
 class TestLayer(str, Enum):
@@ -29,6 +30,8 @@ class Severity(str, Enum):
 class TestStep(BaseModel):
     """Шаг тест-кейса."""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     id: str = Field(..., description="Уникальный идентификатор шага")
     name: str = Field(..., description="Название шага")
     description: str = Field(..., description="Описание действия")
@@ -38,13 +41,12 @@ class TestStep(BaseModel):
     skip_reason: Optional[str] = Field(default="", alias="skipReason")
     attachments: Optional[str] = Field(default="")
 
-    class Config:
-        allow_population_by_field_name = True
-
 
 class TestCase(BaseModel):
     """Модель тест-кейса для генерации автотестов."""
 
+    model_config = ConfigDict(populate_by_name=True, use_enum_values=True)
+
     # Основные поля
     id: str = Field(..., description="Уникальный идентификатор тест-кейса")
     name: str = Field(..., description="Название тест-кейса")
@@ -84,17 +86,18 @@ class TestCase(BaseModel):
     created_at: Optional[int] = Field(default=None, alias="createdAt")
     updated_at: Optional[int] = Field(default=None, alias="updatedAt")
 
-    @validator("steps")
+    @field_validator("steps")
+    @classmethod
     def validate_steps(cls, v):
         """Валидация наличия шагов."""
         if not v:
             raise ValueError("Тест-кейс должен содержать хотя бы один шаг")
         return v
 
-    @property
+    @cached_property
     def tags_list(self) -> List[str]:
-        """Возвращает список тегов."""
-        return [tag.strip() for tag in self.tags.split(",") if tag.strip()]
+        """Возвращает список тегов (вычисляется один раз)."""
+        return [tag.strip() for tag in (self.tags or "").split(",") if tag.strip()]
 
     @classmethod
     def parse_file(cls, file_path: Union[str, Path]) -> "TestCase":
@@ -107,32 +110,25 @@ class TestCase(BaseModel):
         Returns:
             Объект TestCase
         """
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Файл не найден: {file_path}")
+        try:
+            raw = Path(file_path).read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Файл не найден: {file_path}") from None
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        return cls.parse_obj(data)
+        return cls.model_validate_json(raw)
 
     @classmethod
-    def parse_json(cls, json_str: str) -> "TestCase":
+    def parse_json(cls, json_str: Union[str, bytes]) -> "TestCase":
         """
         Парсит тест-кейс из JSON строки.
 
         Args:
-            json_str: JSON строка
+            json_str: JSON строка или байты в UTF-8
 
         Returns:
             Объект TestCase
         """
-        data = json.loads(json_str)
-        return cls.parse_obj(data)
-
-    class Config:
-        allow_population_by_field_name = True
-        use_enum_values = True
+        return cls.model_validate_json(json_str)
 
 
 class CodeStyle(str, Enum):
@@ -207,24 +203,37 @@ class GenerationStatus(str, Enum):
     VALIDATION_ERROR = "validation_error"
 
 
-class GeneratedFile(BaseModel):
-    """Информация о сгенерированном файле."""
+@dataclass(slots=True, frozen=True)
+class GeneratedFile:
+    """
+    Информация о сгенерированном файле.
+
+    Неизменяемый: content_bytes и size_bytes вычисляются по content при создании.
+    """
 
-    path: Path = Field(..., description="Путь к файлу")
-    content: str = Field(..., description="Содержимое файла")
-    file_type: str = Field(..., description="Тип файла (test, page_object, fixture)")
-    size_bytes: int = Field(..., description="Размер файла в байтах")
+    path: Path  # Путь к файлу
+    content: str  # Содержимое файла
+    file_type: str  # Тип файла (test, page_object, fixture)
+    size_bytes: Optional[int] = None  # Размер файла в байтах (вычисляется по содержимому)
+    # Содержимое в UTF-8: кодируется один раз, в сериализацию не входит
+    content_bytes: bytes = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        content_bytes = self.content.encode("utf-8")
+        object.__setattr__(self, "content_bytes", content_bytes)
+        object.__setattr__(self, "size_bytes", len(content_bytes))
 
-class LLMRequest(BaseModel):
+
+@dataclass(slots=True)
+class LLMRequest:
     """Информация о запросе к LLM."""
 
-    prompt: str = Field(..., description="Отправленный промпт")
-    model: str = Field(..., description="Использованная модель")
-    temperature: float = Field(..., description="Температура")
-    tokens_used: Optional[int] = Field(default=None, description="Использовано токенов")
-    response_time_ms: Optional[float] = Field(default=None, description="Время ответа в мс")
-    retry_count: int = Field(default=0, description="Количество повторов")
+    prompt: str  # Отправленный промпт
+    model: str  # Использованная модель
+    temperature: float  # Температура
+    tokens_used: Optional[int] = None  # Использовано токенов
+    response_time_ms: Optional[float] = None  # Время ответа в мс
+    retry_count: int = 0  # Количество повторов
 
 
 class GenerationResult(BaseModel):
@@ -308,6 +317,10 @@ class RepositoryContext(BaseModel):
         default=None,
         description="Паттерны файлов для исключения",
     )
+    max_index_bytes: int = Field(
+        default=512 * 1024,
+        description="Максимальный размер файла (байт), для которого выполняется разбор AST при индексации",
+    )
 
     # Дополнительные настройки
     branch: Optional[str] = Field(default=None, description="Ветка для анализа")
@@ -1,7 +1,8 @@
 """Построитель структуры директорий."""
 
+import os
 from pathlib import Path
-from typing import List
+from typing import List, Set
 
 from test_generator.models import GeneratedFile
 from test_generator.utils.logger import get_logger
@@ -12,16 +13,24 @@ logger = get_logger(__name__)
 class DirectoryBuilder:
     """Построитель структуры директорий для тестов."""
 
-    @staticmethod
-    def build_structure(output_dir: Path, files: List[GeneratedFile]) -> None:
+    # Директории, структура которых уже создана в текущем процессе
+    _built: Set[Path] = set()
+
+    @classmethod
+    def build_structure(cls, output_dir: Path, files: List[GeneratedFile]) -> None:
         """
         Создает структуру директорий для файлов.
 
+        Повторный вызов для той же директории не обращается к диску.
+
         Args:
             output_dir: Базовая директория
             files: Список файлов
         """
-        output_dir = Path(output_dir)
+        output_dir = Path(os.path.abspath(output_dir))
+        if output_dir in cls._built:
+            return
+
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Создание стандартной структуры
@@ -31,8 +40,20 @@ class DirectoryBuilder:
         # Создание __init__.py файлов
         for init_dir in [output_dir, output_dir / "pages", output_dir / "tests"]:
             init_file = init_dir / "__init__.py"
-            if not init_file.exists():
-                init_file.write_text("", encoding="utf-8")
+            try:
+                os.close(os.open(init_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+            except FileExistsError:
+                pass
 
+        cls._built.add(output_dir)
         logger.debug(f"Структура директорий создана в {output_dir}")
 
+    @classmethod
+    def forget(cls, output_dir: Path) -> None:
+        """
+        Сбрасывает отметку о созданной структуре (например, после удаления директории).
+
+        Args:
+            output_dir: Базовая директория
+        """
+        cls._built.discard(Path(os.path.abspath(output_dir)))
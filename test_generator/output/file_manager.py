@@ -1,5 +1,8 @@
 """Управление файлами."""
 
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
@@ -9,6 +12,9 @@ from test_generator.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Максимум потоков для параллельной записи файлов
+_MAX_WRITE_WORKERS = 8
+
 
 class FileManager:
     """Менеджер файлов для сохранения сгенерированного кода."""
@@ -34,27 +40,98 @@ class FileManager:
             OutputError: При ошибках сохранения
         """
         output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir_str = os.fspath(output_dir)
+        os.makedirs(output_dir_str, exist_ok=True)
 
+        # Пути вычисляются один раз строками, без промежуточных объектов Path.
+        # Один путь не пишется двумя потоками: при перезаписи остается последний
+        # файл (как при последовательной записи), иначе повтор - ошибка
+        targets_by_path = {}
         for file in files:
-            file_path = output_dir / file.path
+            file_path = os.path.normpath(os.path.join(output_dir_str, os.fspath(file.path)))
+            previous = targets_by_path.get(file_path)
+            if previous is not None and not overwrite:
+                raise OutputError(
+                    f"Файлы {previous.path} и {file.path} сохраняются по одному пути: {file_path}"
+                )
+            targets_by_path[file_path] = file
+        targets = list(targets_by_path.items())
+
+        # Создание директорий (их немного, поэтому последовательно)
+        created_dirs = {output_dir_str}
+        for file_path, _ in targets:
+            parent = os.path.dirname(file_path)
+            if parent not in created_dirs:
+                os.makedirs(parent, exist_ok=True)
+                created_dirs.add(parent)
+
+        # Запись файлов - чистый ввод-вывод, поэтому выполняется параллельно
+        if targets:
+            with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(targets))) as executor:
+                list(executor.map(lambda target: FileManager._write_one(*target, overwrite), targets))
 
-            # Проверка существования
-            if file_path.exists() and not overwrite:
-                raise OutputError(f"Файл уже существует: {file_path}")
+        logger.info(f"Сохранено {len(files)} файлов в {output_dir}")
+        return output_dir
+
+    @staticmethod
+    def _write_one(file_path: str, file: GeneratedFile, overwrite: bool) -> None:
+        """
+        Сохраняет один файл.
 
-            # Создание директорий
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+        Содержимое пишется во временный файл рядом с целевым и переносится
+        на место через os.replace, поэтому при ошибке записи недописанный
+        файл не остается. Без перезаписи целевой путь сначала занимается
+        через O_EXCL, что атомарно проверяет его существование.
 
-            # Сохранение
-            try:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(file.content)
+        Args:
+            file_path: Полный путь к файлу
+            file: Файл для сохранения
+            overwrite: Перезаписывать существующий файл
 
-                logger.debug(f"Файл сохранен: {file_path} ({file.size_bytes} байт)")
-            except Exception as e:
+        Raises:
+            OutputError: При ошибках сохранения
+        """
+        binary = getattr(os, "O_BINARY", 0)
+        reserved = False
+        if not overwrite:
+            try:
+                os.close(os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | binary, 0o644))
+                reserved = True
+            except FileExistsError:
+                raise OutputError(f"Файл уже существует: {file_path}")
+            except OSError as e:
                 raise OutputError(f"Ошибка сохранения файла {file_path}: {e}") from e
 
-        logger.info(f"Сохранено {len(files)} файлов в {output_dir}")
-        return output_dir
+        directory, name = os.path.split(file_path)
+        tmp_path = os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | binary, 0o644)
+            try:
+                data = file.content_bytes
+                FileManager._write_all(fd, data)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, file_path)
+            logger.debug(f"Файл сохранен: {file_path} ({len(data)} байт)")
+        except Exception as e:
+            for path in (tmp_path, file_path) if reserved else (tmp_path,):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            raise OutputError(f"Ошибка сохранения файла {file_path}: {e}") from e
+
+    @staticmethod
+    def _write_all(fd: int, data: bytes) -> None:
+        """
+        Записывает данные в файловый дескриптор целиком.
+
+        Args:
+            fd: Файловый дескриптор
+            data: Данные для записи
+        """
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
 
@@ -1,8 +1,42 @@
 """Парсер тест-кейсов."""
 
-from test_generator.parser.json_parser import TestCaseParser
-from test_generator.parser.validator import TestCaseValidator
-from test_generator.parser.normalizer import TestCaseNormalizer
+import importlib
+
+# Компоненты импортируются при первом обращении (PEP 562)
+_LAZY = {
+    "TestCaseParser": "test_generator.parser.json_parser",
+    "TestCaseValidator": "test_generator.parser.validator",
+    "TestCaseNormalizer": "test_generator.parser.normalizer",
+}
 
 __all__ = ["TestCaseParser", "TestCaseValidator", "TestCaseNormalizer"]
 
+
+def __getattr__(name):
+    """
+    Импортирует компонент парсера при первом обращении.
+
+    Args:
+        name: Имя атрибута
+
+    Returns:
+        Значение атрибута
+
+    Raises:
+        AttributeError: Если атрибута нет в пакете
+    """
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """
+    Возвращает имена пакета вместе с еще не загруженными компонентами.
+
+    Returns:
+        Отсортированный список имен
+    """
+    return sorted(set(globals()) | set(__all__))
@@ -2,7 +2,14 @@
 
 import json
 from pathlib import Path
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, Iterator
+
+from pydantic import ValidationError as PydanticValidationError
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 from test_generator.models import TestCase
 from test_generator.utils.exceptions import TestCaseParseError
@@ -11,11 +18,24 @@ from test_generator.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _is_json_syntax_error(error: PydanticValidationError) -> bool:
+    """
+    Проверяет, что ошибка валидации вызвана синтаксисом JSON, а не данными.
+
+    Args:
+        error: Ошибка model_validate_json
+
+    Returns:
+        True если входные данные не являются корректным JSON
+    """
+    return all(item["type"] == "json_invalid" for item in error.errors())
+
+
 class TestCaseParser:
     """Парсер тест-кейсов из различных источников."""
 
     @staticmethod
-    def parse(test_case: Union[TestCase, str, Path, Dict[str, Any]]) -> TestCase:
+    def parse(test_case: Union[TestCase, str, bytes, Path, Dict[str, Any]]) -> TestCase:
         """
         Парсит тест-кейс из различных форматов.
 
@@ -25,6 +45,7 @@ class TestCaseParser:
                 - Пути к JSON файлу (str или Path)
                 - Словаря с данными
                 - JSON строки
+                - JSON в байтах (UTF-8)
 
         Returns:
             Объект TestCase
@@ -37,20 +58,34 @@ class TestCaseParser:
             if isinstance(test_case, TestCase):
                 return test_case
 
+            # Если JSON строка: файловая система не затрагивается
+            if isinstance(test_case, str) and test_case.lstrip().startswith("{"):
+                try:
+                    return TestCase.parse_json(test_case)
+                except ValueError as e:
+                    raise TestCaseParseError(f"Не удалось распарсить тест-кейс: {test_case}") from e
+
             # Если путь к файлу
             if isinstance(test_case, (str, Path)):
                 path = Path(test_case)
-                if path.exists() and path.is_file():
-                    return TestCase.parse_file(path)
+                if path.is_file():
+                    return TestCase.model_validate_json(path.read_bytes())
                 # Если это JSON строка
                 try:
                     return TestCase.parse_json(str(test_case))
-                except (json.JSONDecodeError, ValueError):
-                    raise TestCaseParseError(f"Не удалось распарсить тест-кейс: {test_case}")
+                except (json.JSONDecodeError, ValueError) as e:
+                    raise TestCaseParseError(f"Не удалось распарсить тест-кейс: {test_case}") from e
+
+            # Если JSON в байтах (например, тело HTTP ответа)
+            if isinstance(test_case, bytes):
+                try:
+                    return TestCase.parse_json(test_case)
+                except ValueError as e:
+                    raise TestCaseParseError("Не удалось распарсить тест-кейс из байтов") from e
 
             # Если словарь
             if isinstance(test_case, dict):
-                return TestCase.parse_obj(test_case)
+                return TestCase.model_validate(test_case)
 
             raise TestCaseParseError(f"Неподдерживаемый тип тест-кейса: {type(test_case)}")
 
@@ -60,3 +95,86 @@ class TestCaseParser:
                 raise
             raise TestCaseParseError(f"Ошибка парсинга тест-кейса: {e}") from e
 
+    @staticmethod
+    def parse_stream(path: Union[str, Path]) -> Iterator[TestCase]:
+        """
+        Последовательно парсит тест-кейсы из файла.
+
+        Формат определяется по первому значащему символу:
+            - "[" — JSON массив тест-кейсов (с ijson разбирается потоково,
+              без него файл загружается целиком);
+            - "{" — NDJSON, по одному тест-кейсу в строке; файл с одним
+              многострочным JSON объектом также поддерживается.
+
+        Args:
+            path: Путь к файлу
+
+        Yields:
+            Объекты TestCase
+
+        Raises:
+            TestCaseParseError: При ошибках парсинга
+        """
+        try:
+            with open(path, "rb") as f:
+                first = TestCaseParser._peek_first_byte(f)
+
+                if first == b"[":
+                    if ijson is not None:
+                        for item in ijson.items(f, "item", use_float=True):
+                            yield TestCase.model_validate(item)
+                    else:
+                        for item in json.load(f):
+                            yield TestCase.model_validate(item)
+                    return
+
+                if first != b"{":
+                    raise TestCaseParseError(f"Файл не содержит JSON объектов или массива: {path}")
+
+                start = f.tell()
+                parsed = 0
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        test_case = TestCase.parse_json(line)
+                    except PydanticValidationError as e:
+                        # Многострочный документ возможен, только если первая строка
+                        # не является полным JSON; ошибки валидации данных не маскируются
+                        if parsed or not _is_json_syntax_error(e):
+                            raise TestCaseParseError(
+                                f"Не удалось распарсить тест-кейс в строке {line_no}: {path}"
+                            ) from e
+                        # Первая строка не является полным объектом: один многострочный документ
+                        f.seek(start)
+                        yield TestCase.model_validate_json(f.read())
+                        return
+                    parsed += 1
+                    yield test_case
+
+        except Exception as e:
+            logger.error(f"Ошибка парсинга тест-кейсов: {e}", exc_info=True)
+            if isinstance(e, TestCaseParseError):
+                raise
+            raise TestCaseParseError(f"Ошибка парсинга тест-кейсов: {e}") from e
+
+    @staticmethod
+    def _peek_first_byte(f) -> bytes:
+        """
+        Возвращает первый непробельный байт файла и устанавливает позицию перед ним.
+
+        Args:
+            f: Файл, открытый в бинарном режиме
+
+        Returns:
+            Первый значащий байт или b"" для пустого файла
+        """
+        while True:
+            position = f.tell()
+            chunk = f.read(4096)
+            if not chunk:
+                return b""
+            stripped = chunk.lstrip()
+            if stripped:
+                f.seek(position + len(chunk) - len(stripped))
+                return stripped[:1]
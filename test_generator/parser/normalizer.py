@@ -1,5 +1,7 @@
 """Нормализатор тест-кейсов."""
 
+from typing import Callable, Iterable, List
+
 from test_generator.models import TestCase
 from test_generator.utils.logger import get_logger
 
@@ -20,20 +22,54 @@ class TestCaseNormalizer:
         Returns:
             Нормализованный тест-кейс
         """
-        # Нормализация строковых полей (удаление лишних пробелов)
-        if test_case.description:
-            test_case.description = test_case.description.strip()
-
-        if test_case.preconditions:
-            test_case.preconditions = test_case.preconditions.strip()
-
-        # Нормализация шагов
-        for step in test_case.steps:
-            step.name = step.name.strip()
-            step.description = step.description.strip()
-            step.expected_result = step.expected_result.strip()
+        TestCaseNormalizer._normalize(test_case, str.strip)
 
         logger.debug(f"Тест-кейс {test_case.id} нормализован")
 
         return test_case
 
+    @staticmethod
+    def normalize_many(test_cases: Iterable[TestCase]) -> List[TestCase]:
+        """
+        Нормализует набор тест-кейсов.
+
+        Args:
+            test_cases: Тест-кейсы для нормализации
+
+        Returns:
+            Нормализованные тест-кейсы в исходном порядке
+        """
+        strip = str.strip
+        normalize = TestCaseNormalizer._normalize
+        normalized = [normalize(test_case, strip) for test_case in test_cases]
+
+        logger.debug(f"Нормализовано тест-кейсов: {len(normalized)}")
+
+        return normalized
+
+    @staticmethod
+    def _normalize(test_case: TestCase, strip: Callable[[str], str]) -> TestCase:
+        """
+        Удаляет лишние пробелы в строковых полях тест-кейса и его шагов.
+
+        Args:
+            test_case: Тест-кейс для нормализации
+            strip: Функция очистки строки (str.strip, связанная заранее)
+
+        Returns:
+            Тот же тест-кейс
+        """
+        description = test_case.description
+        if description:
+            test_case.description = strip(description)
+
+        preconditions = test_case.preconditions
+        if preconditions:
+            test_case.preconditions = strip(preconditions)
+
+        for step in test_case.steps:
+            step.name = strip(step.name)
+            step.description = strip(step.description)
+            step.expected_result = strip(step.expected_result)
+
+        return test_case
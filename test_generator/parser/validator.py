@@ -1,5 +1,7 @@
 """Валидатор тест-кейсов."""
 
+from typing import List
+
 from test_generator.models import TestCase
 from test_generator.utils.exceptions import ValidationError
 from test_generator.utils.logger import get_logger
@@ -21,6 +23,33 @@ class TestCaseValidator:
         Raises:
             ValidationError: При ошибках валидации
         """
+        # Быстрая проверка: корректный тест-кейс не требует сборки сообщений
+        if (
+            test_case.id
+            and test_case.name
+            and test_case.expected_result
+            and test_case.steps
+            and all(step.id and step.name and step.description for step in test_case.steps)
+        ):
+            logger.debug(f"Тест-кейс {test_case.id} успешно валидирован")
+            return
+
+        errors = TestCaseValidator._collect_errors(test_case)
+        error_msg = "Ошибки валидации тест-кейса:\n" + "\n".join(f"  - {e}" for e in errors)
+        logger.error(error_msg)
+        raise ValidationError(error_msg)
+
+    @staticmethod
+    def _collect_errors(test_case: TestCase) -> List[str]:
+        """
+        Собирает описания всех ошибок тест-кейса.
+
+        Args:
+            test_case: Тест-кейс, не прошедший быструю проверку
+
+        Returns:
+            Список сообщений об ошибках
+        """
         errors = []
 
         # Проверка обязательных полей
@@ -45,10 +74,4 @@ class TestCaseValidator:
             if not step.description:
                 errors.append(f"Шаг {i}: Описание шага обязательно")
 
-        if errors:
-            error_msg = "Ошибки валидации тест-кейса:\n" + "\n".join(f"  - {e}" for e in errors)
-            logger.error(error_msg)
-            raise ValidationError(error_msg)
-
-        logger.debug(f"Тест-кейс {test_case.id} успешно валидирован")
-
+        return errors
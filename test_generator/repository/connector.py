@@ -1,10 +1,12 @@
 """Подключение к репозиторию."""
 
+import hashlib
 import os
 import tempfile
 import shutil
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 try:
     import gitlab
@@ -13,6 +15,11 @@ except ImportError:
     gitlab = None
     Repo = None
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 from test_generator.models import RepositoryContext
 from test_generator.utils.exceptions import RepositoryConnectionError
 from test_generator.utils.logger import get_logger
@@ -20,6 +27,36 @@ from test_generator.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _get_cache_dir() -> Path:
+    """Возвращает директорию кеша репозиториев (переопределяется KEIRA_CACHE)."""
+    cache_dir = os.environ.get("KEIRA_CACHE")
+    if cache_dir:
+        return Path(cache_dir)
+    return Path.home() / ".cache" / "keira" / "repos"
+
+
+@contextmanager
+def _cache_lock(cache_dir: Path) -> Iterator[None]:
+    """
+    Межпроцессная блокировка bare-репозитория в кеше.
+
+    Используется fcntl.flock; на платформах без fcntl блокировка не выполняется.
+
+    Args:
+        cache_dir: Путь к bare-репозиторию
+    """
+    if fcntl is None:
+        yield
+        return
+
+    with open(f"{cache_dir}.lock", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
 class RepositoryConnector:
     """Управление подключением к репозиторию."""
 
@@ -33,6 +70,7 @@ class RepositoryConnector:
         self.context = context
         self.local_path: Optional[Path] = None
         self._temp_dir: Optional[tempfile.TemporaryDirectory] = None
+        self._cache_dir: Optional[Path] = None
 
     def connect(self) -> Path:
         """
@@ -92,6 +130,9 @@ class RepositoryConnector:
             if not repo_url:
                 raise RepositoryConnectionError("URL репозитория не указан (ни repository_url, ни gitlab_url+project_path)")
 
+            # Ключ кеша строится по URL без токена
+            cache_url = repo_url
+
             # Аутентификация
             if self.context.auth_type == "token" and self.context.auth_token:
                 # Добавление токена в URL
@@ -111,21 +152,16 @@ class RepositoryConnector:
                         parts = repo_url.replace("https://", "").split("/", 1)
                         repo_url = f"https://{self.context.auth_token}@{parts[0]}/{parts[1]}"
 
-            # Клонирование
-            logger.info(f"Клонирование репозитория: {self.context.repository_url}")
-            if self.context.auth_type == "token" and self.context.auth_token:
-                logger.debug(f"Использование токена для аутентификации (URL изменен)")
-            repo = Repo.clone_from(
-                repo_url,
-                temp_path,
-                depth=1,  # Неглубокое клонирование для экономии времени
-            )
-
-            # Переключение на нужную ветку/коммит
-            if self.context.branch:
-                repo.git.checkout(self.context.branch)
-            elif self.context.commit:
-                repo.git.checkout(self.context.commit)
+            # Извлечение через локальный кеш, при ошибке — обычное клонирование
+            try:
+                self._checkout_from_cache(repo_url, cache_url, temp_path)
+            except Exception as e:
+                logger.warning(f"Кеш репозиториев недоступен, выполняется клонирование: {e}")
+                self._cache_dir = None
+                self._temp_dir.cleanup()
+                self._temp_dir = tempfile.TemporaryDirectory()
+                temp_path = Path(self._temp_dir.name)
+                self._clone_into(repo_url, temp_path)
 
             self.local_path = temp_path
             logger.info(f"Репозиторий клонирован в: {temp_path}")
@@ -136,6 +172,76 @@ class RepositoryConnector:
             logger.error(f"Ошибка клонирования репозитория: {e}", exc_info=True)
             raise RepositoryConnectionError(f"Не удалось клонировать репозиторий: {e}") from e
 
+    def _checkout_from_cache(self, repo_url: str, cache_url: str, temp_path: Path) -> None:
+        """
+        Извлекает репозиторий через кеш bare-репозиториев.
+
+        Кеш хранится между запусками и обновляется через git fetch; рабочая
+        копия создается как git worktree во временной директории. URL с токеном
+        передается только в fetch и в кеше не сохраняется.
+
+        Args:
+            repo_url: URL для загрузки (может содержать токен)
+            cache_url: URL без токена для ключа кеша
+            temp_path: Пустая директория для рабочей копии
+        """
+        cache_key = hashlib.sha256(cache_url.encode("utf-8")).hexdigest()
+        cache_dir = _get_cache_dir() / f"{cache_key}.git"
+        cache_dir.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.context.branch:
+            ref = self.context.branch
+        elif self.context.commit:
+            ref = self.context.commit
+        else:
+            ref = "HEAD"
+
+        with _cache_lock(cache_dir):
+            if cache_dir.exists():
+                repo = Repo(cache_dir)
+                logger.info(f"Обновление репозитория из кеша: {cache_dir}")
+            else:
+                repo = Repo.init(cache_dir, bare=True)
+                logger.info(f"Создание кеша репозитория: {cache_dir}")
+
+            logger.info(f"Загрузка репозитория: {self.context.repository_url}")
+            repo.git.fetch(repo_url, ref, depth=1, no_tags=True)
+            repo.git.worktree("add", "--detach", str(temp_path), "FETCH_HEAD")
+
+        self._cache_dir = cache_dir
+
+    def _clone_into(self, repo_url: str, temp_path: Path) -> None:
+        """
+        Клонирует репозиторий во временную директорию без кеша.
+
+        Args:
+            repo_url: URL для клонирования (может содержать токен)
+            temp_path: Пустая директория для клона
+        """
+        logger.info(f"Клонирование репозитория: {self.context.repository_url}")
+        if self.context.auth_type == "token" and self.context.auth_token:
+            logger.debug(f"Использование токена для аутентификации (URL изменен)")
+        # Неглубокое частичное клонирование одной ветки без тегов: блобы
+        # загружаются только для извлекаемого дерева
+        clone_kwargs = {
+            "depth": 1,
+            "filter": "blob:none",
+            "single_branch": True,
+            "no_tags": True,
+        }
+        if self.context.branch:
+            # Клон сразу создается на нужной ветке
+            clone_kwargs["branch"] = self.context.branch
+        elif self.context.commit:
+            # Рабочее дерево извлекается один раз, уже для нужного коммита
+            clone_kwargs["no_checkout"] = True
+
+        repo = Repo.clone_from(repo_url, temp_path, **clone_kwargs)
+
+        if not self.context.branch and self.context.commit:
+            repo.git.fetch("origin", self.context.commit, depth=1)
+            repo.git.checkout("--detach", "FETCH_HEAD")
+
     def disconnect(self) -> None:
         """Отключается от репозитория и очищает временные файлы."""
         if self._temp_dir:
@@ -145,6 +251,15 @@ class RepositoryConnector:
             except Exception as e:
                 logger.warning(f"Ошибка очистки временной директории: {e}")
 
+        # Удаление записи о рабочей копии из кеша
+        if self._cache_dir:
+            try:
+                with _cache_lock(self._cache_dir):
+                    Repo(self._cache_dir).git.worktree("prune")
+            except Exception as e:
+                logger.warning(f"Ошибка очистки кеша репозитория: {e}")
+            self._cache_dir = None
+
         self.local_path = None
 
     def get_local_path(self) -> Optional[Path]:
@@ -2,9 +2,25 @@
 
 import hashlib
 import ast
+import fnmatch
+import os
+import re
+import subprocess
+from sys import intern
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Optional, Set
-from datetime import datetime
+from stat import S_ISREG
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Pattern, Set, Tuple
+
+try:
+    from blake3 import blake3 as _fast_hash
+except ImportError:
+    try:
+        from xxhash import xxh3_128 as _fast_hash
+    except ImportError:
+        _fast_hash = None
 
 from test_generator.repository.models import (
     RepositoryIndex,
@@ -19,6 +35,81 @@ from test_generator.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Служебные директории: обход в них не спускается
+_PRUNED_DIRS = frozenset({"__pycache__", ".git", "node_modules", "venv", ".venv"})
+
+# Имена для определения структуры проекта
+_TEST_DIR_NAMES = frozenset({"tests", "test", "autotests"})
+_PAGE_DIR_NAMES = frozenset({"pages", "page_objects", "page"})
+_FIXTURE_FILE_NAME = "conftest.py"
+_CONFIG_FILE_NAMES = frozenset({"pytest.ini", "setup.cfg", "pyproject.toml", "requirements.txt"})
+
+# Классификация файла по имени (без учета регистра):
+# тест — имя начинается с "test" или содержит "test_"/"_test.py";
+# фикстура — conftest.py или "fixture" в имени; конфигурация — точное имя
+_FILE_NAME_TYPE_RE = re.compile(
+    r"(?P<test>test|.*?(?:test_|_test\.py))"
+    r"|(?P<fixture>conftest\.py$|.*?fixture)"
+    r"|(?P<config>(?:pytest\.ini|setup\.cfg|pyproject\.toml|requirements\.txt)$)",
+    re.IGNORECASE | re.DOTALL,
+)
+_PAGE_PATH_RE = re.compile("page", re.IGNORECASE)
+
+# Ниже этого числа файлов пул процессов не окупает затрат на запуск
+_PARALLEL_MIN_FILES = 200
+_WORKER_CHUNKSIZE = 64
+
+# Паттерн исключения по имени директории: "**/<dir>/**"
+_SEGMENT_PATTERN_RE = re.compile(r"\*\*/([^/*?\[\]]+)/\*\*")
+
+# Запись git ls-files --stage: "<режим> <хеш> <стадия>\t"
+_GIT_STAGE_RE = re.compile(r"(?P<mode>[0-7]{6}) (?P<blob>[0-9a-f]{40,64}) [0-3]\t")
+_GIT_SUBMODULE_MODE = "160000"
+
+
+class _IndexVisitor(ast.NodeVisitor):
+    """
+    Собирает импорты, классы и функции для индекса.
+
+    Имена интернируются: одни и те же модули и классы повторяются во многих
+    файлах и в индексе хранятся в единственном экземпляре.
+
+    В тела функций обход не спускается: вложенные определения и локальные
+    импорты для индекса не нужны. Тела классов обходятся, чтобы учесть методы
+    (в том числе тестовые методы в классах pytest).
+    """
+
+    def __init__(self) -> None:
+        self.imports: List[str] = []
+        self.classes: List[str] = []
+        self.functions: List[str] = []
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self.imports.append(intern(alias.name))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        module = node.module or ""
+        for alias in node.names:
+            self.imports.append(intern(f"{module}.{alias.name}" if module else alias.name))
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.classes.append(intern(node.name))
+        for child in node.body:
+            self.visit(child)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.functions.append(intern(node.name))
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        pass
+
+    def _skip(self, node: ast.AST) -> None:
+        pass
+
+    # Выражения и присваивания не содержат определений
+    visit_Expr = visit_Assign = visit_AnnAssign = visit_AugAssign = visit_Return = _skip
+
 
 class RepositoryIndexer:
     """Индексация файлов и структуры репозитория."""
@@ -37,14 +128,21 @@ class RepositoryIndexer:
         context: RepositoryContext,
         force: bool = False,
         incremental: bool = True,
+        previous_index: Optional[RepositoryIndex] = None,
     ) -> RepositoryIndex:
         """
         Индексирует репозиторий.
 
+        При инкрементальном обновлении файлы, у которых с записью в previous_index
+        совпадают размер и время изменения, не перечитываются. В Git-репозитории
+        файл также узнается по идентификатору blob, поэтому неизмененные файлы
+        не перечитываются и в новой рабочей копии удаленного репозитория.
+
         Args:
             context: Контекст репозитория
             force: Принудительная переиндексация
             incremental: Инкрементальное обновление
+            previous_index: Предыдущий индекс для инкрементального обновления
 
         Returns:
             Индекс репозитория
@@ -60,11 +158,14 @@ class RepositoryIndexer:
 
             logger.info(f"Начало индексации репозитория: {repo_path}")
 
-            # Анализ структуры
-            structure = self._analyze_structure(repo_path, context)
+            # Обход репозитория: структура и кандидаты на индексацию за один проход
+            structure, candidates = self._scan_repository(repo_path, context)
 
             # Индексация файлов
-            files = self._index_files(repo_path, context, incremental)
+            previous_files: Dict[str, IndexedFile] = {}
+            if incremental and previous_index is not None:
+                previous_files = {f.path.as_posix(): f for f in previous_index.files}
+            files = self._index_files(candidates, previous_files, context.max_index_bytes)
 
             # Создание индекса
             index = RepositoryIndex(
@@ -90,163 +191,349 @@ class RepositoryIndexer:
             logger.error(f"Ошибка индексации репозитория: {e}", exc_info=True)
             raise RepositoryIndexError(f"Ошибка индексации: {e}") from e
 
-    def _analyze_structure(
+    def _scan_repository(
         self, repo_path: Path, context: RepositoryContext
-    ) -> ProjectStructure:
+    ) -> Tuple[ProjectStructure, List[Tuple[str, str, os.stat_result, Optional[str]]]]:
         """
-        Анализирует структуру проекта.
+        Обходит репозиторий за один проход.
+
+        Одновременно собирает структуру проекта (директории тестов и Page Objects,
+        фикстуры, конфигурационные файлы) и список файлов-кандидатов на индексацию.
+        Для Git-репозитория список файлов берется из git ls-files (файлы,
+        игнорируемые через .gitignore, не индексируются), иначе выполняется
+        обход файловой системы.
 
         Args:
             repo_path: Путь к репозиторию
             context: Контекст репозитория
 
         Returns:
-            Структура проекта
+            Кортеж (структура проекта, список (путь, относительный путь, stat,
+            идентификатор blob Git или None))
         """
         repo_path = Path(repo_path)
+        root = os.fspath(repo_path)
         structure = ProjectStructure(root_path=repo_path)
 
-        # Поиск директорий с тестами
-        test_dirs = self._find_directories(repo_path, ["tests", "test", "autotests"])
-        structure.test_directories = test_dirs
+        include_re = self._compile_include_patterns(context.include_patterns or ["**/*.py"])
+        # Исключения вида "**/<dir>/**" проверяются по сегментам пути,
+        # остальные паттерны объединяются в одно выражение
+        exclude_segments, exclude_globs = self._partition_exclude_patterns(
+            context.exclude_patterns or []
+        )
+        exclude_re = self._compile_exclude_patterns(exclude_globs)
+
+        git_blobs = self._git_ls_files(repo_path)
+        if git_blobs is not None:
+            entries = self._iter_git_entries(git_blobs)
+        else:
+            git_blobs = {}
+            entries = self._walk(repo_path)
+
+        candidates: List[Tuple[str, str, os.stat_result, Optional[str]]] = []
+        for relpath, is_dir, entry in entries:
+            name = relpath.rpartition("/")[2]
+            path = entry.path if entry is not None else os.path.join(root, relpath)
+
+            # Пути из индекса Git могут отсутствовать на диске (удаленные файлы),
+            # поэтому для них существование проверяется отдельно
+            if is_dir:
+                if name in _TEST_DIR_NAMES:
+                    if entry is not None or os.path.isdir(path):
+                        structure.test_directories.append(Path(path))
+                elif name in _PAGE_DIR_NAMES:
+                    if entry is not None or os.path.isdir(path):
+                        structure.page_object_directories.append(Path(path))
+                continue
+
+            if name == _FIXTURE_FILE_NAME:
+                if entry is not None or os.path.isfile(path):
+                    structure.fixture_files.append(Path(path))
+            elif name in _CONFIG_FILE_NAMES:
+                if entry is not None or os.path.isfile(path):
+                    structure.config_files.append(Path(path))
 
-        # Поиск директорий с Page Objects
-        page_dirs = self._find_directories(repo_path, ["pages", "page_objects", "page"])
-        structure.page_object_directories = page_dirs
+            if not include_re.match(relpath):
+                continue
+            if exclude_segments and not exclude_segments.isdisjoint(relpath.split("/")[:-1]):
+                continue
+            if exclude_re is not None and exclude_re.match(relpath):
+                continue
 
-        # Поиск файлов фикстур
-        fixture_files = list(repo_path.rglob("conftest.py"))
-        structure.fixture_files = fixture_files
+            try:
+                # У DirEntry результат stat кешируется
+                stat = entry.stat() if entry is not None else os.stat(path)
+            except OSError as e:
+                logger.debug(f"Не удалось получить информацию о файле {path}: {e}")
+                continue
+            if not S_ISREG(stat.st_mode):
+                continue
 
-        # Поиск конфигурационных файлов
-        config_files = []
-        for pattern in ["pytest.ini", "setup.cfg", "pyproject.toml", "requirements.txt"]:
-            config_files.extend(list(repo_path.rglob(pattern)))
-        structure.config_files = config_files
+            candidates.append((path, relpath, stat, git_blobs.get(relpath)))
 
-        return structure
+        return structure, candidates
 
-    def _find_directories(self, root: Path, names: List[str]) -> List[Path]:
+    @staticmethod
+    def _git_ls_files(repo_path: Path) -> Optional[Dict[str, Optional[str]]]:
         """
-        Находит директории по именам.
+        Получает список файлов Git-репозитория с идентификаторами blob.
+
+        Возвращаются отслеживаемые файлы и неотслеживаемые файлы, не попадающие
+        под правила .gitignore. В отличие от обхода файловой системы,
+        игнорируемые файлы (сборка, кеши) и содержимое подмодулей не индексируются.
+        Пути неслитых файлов (конфликт слияния) возвращаются один раз.
+
+        Идентификатор blob известен только для отслеживаемых файлов, содержимое
+        которых в рабочей копии совпадает с индексом Git. По нему неизмененные
+        файлы узнаются и в новой рабочей копии (например, после повторного
+        клонирования), где время изменения у всех файлов новое.
 
         Args:
-            root: Корневой путь
-            names: Список имен для поиска
+            repo_path: Путь к репозиторию
 
         Returns:
-            Список найденных директорий
+            Словарь относительный путь -> идентификатор blob или None;
+            None вместо словаря, если это не Git-репозиторий или git недоступен
+        """
+        root = os.fspath(repo_path)
+        if not os.path.exists(os.path.join(root, ".git")):
+            return None
+
+        try:
+            result = subprocess.run(
+                [
+                    "git", "-C", root, "ls-files", "-z",
+                    "--stage", "--cached", "--others", "--exclude-standard",
+                ],
+                capture_output=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.debug(f"git ls-files недоступен, используется обход файловой системы: {e}")
+            return None
+
+        # Словарь сохраняет порядок и убирает повторы стадий неслитых путей
+        blobs: Dict[str, Optional[str]] = {}
+        for record in os.fsdecode(result.stdout).split("\0"):
+            if not record:
+                continue
+            # Отслеживаемые пути выводятся как "<режим> <хеш> <стадия>\t<путь>",
+            # неотслеживаемые - просто как путь
+            match = _GIT_STAGE_RE.match(record)
+            if match is None:
+                blobs[record] = None
+            elif match.group("mode") != _GIT_SUBMODULE_MODE:
+                path = record[match.end():]
+                # У неслитого пути несколько стадий с разным содержимым
+                blobs[path] = match.group("blob") if path not in blobs else None
+
+        # Для измененных в рабочей копии файлов blob из индекса не соответствует
+        # содержимому на диске
+        try:
+            modified = subprocess.run(
+                ["git", "-C", root, "ls-files", "-z", "--modified"],
+                capture_output=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.debug(f"Не удалось получить список измененных файлов: {e}")
+            return dict.fromkeys(blobs)
+        for path in os.fsdecode(modified.stdout).split("\0"):
+            if path in blobs:
+                blobs[path] = None
+        return blobs
+
+    @staticmethod
+    def _iter_git_entries(git_paths: Iterable[str]) -> Iterator[Tuple[str, bool, None]]:
+        """
+        Преобразует список файлов Git в записи обхода.
+
+        Директории выводятся из путей файлов, пути внутри служебных директорий
+        (_PRUNED_DIRS) пропускаются. Записи упорядочиваются так же, как при
+        обходе файловой системы (_walk).
+
+        Args:
+            git_paths: Относительные пути файлов
+
+        Yields:
+            Кортежи (относительный путь, является ли директорией, None)
+        """
+        records: List[Tuple[str, bool, None]] = []
+        seen_dirs: Set[str] = set()
+
+        for relpath in git_paths:
+            parts = relpath.split("/")
+            if any(part in _PRUNED_DIRS for part in parts[:-1]):
+                continue
+
+            prefix = ""
+            for part in parts[:-1]:
+                prefix += part
+                if prefix not in seen_dirs:
+                    seen_dirs.add(prefix)
+                    records.append((prefix, True, None))
+                prefix += "/"
+            records.append((relpath, False, None))
+
+        # Порядок _walk: содержимое директории по имени, файлы директории
+        # раньше содержимого ее поддиректорий
+        records.sort(key=lambda record: _walk_order_key(record[0]))
+        return iter(records)
+
+    @staticmethod
+    def _walk(repo_path: Path, rel_root: str = "") -> Iterator[Tuple[str, bool, os.DirEntry]]:
         """
-        directories = []
-        for name in names:
-            found = list(root.rglob(name))
-            directories.extend([d for d in found if d.is_dir()])
-        return directories
+        Рекурсивно обходит репозиторий через os.scandir.
+
+        Служебные директории (_PRUNED_DIRS) отсекаются до спуска в них,
+        символические ссылки на директории не разворачиваются.
+
+        Args:
+            repo_path: Путь к репозиторию
+            rel_root: Относительный путь поддиректории для обхода (с "/" на конце)
+
+        Yields:
+            Кортежи (относительный путь через "/", является ли директорией, DirEntry)
+        """
+        stack = [(os.path.join(os.fspath(repo_path), rel_root), rel_root)]
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError as e:
+                logger.debug(f"Не удалось прочитать директорию {dir_path}: {e}")
+                continue
+
+            subdirs = []
+            for entry in entries:
+                relpath = rel_dir + entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in _PRUNED_DIRS:
+                            continue
+                        yield relpath, True, entry
+                        subdirs.append((entry.path, relpath + "/"))
+                    elif entry.is_file():
+                        yield relpath, False, entry
+                except OSError:
+                    continue
+
+            # Обратный порядок сохраняет алфавитный обход в глубину
+            stack.extend(reversed(subdirs))
 
     def _index_files(
         self,
-        repo_path: Path,
-        context: RepositoryContext,
-        incremental: bool,
+        candidates: List[Tuple[str, str, os.stat_result, Optional[str]]],
+        previous_files: Dict[str, IndexedFile],
+        max_parse_bytes: int,
     ) -> List[IndexedFile]:
         """
         Индексирует файлы репозитория.
 
+        Чтение, хеширование и разбор AST выполняются в _index_file_worker;
+        для крупных репозиториев — параллельно в пуле процессов.
+
+        Запись предыдущего индекса переиспользуется без чтения файла, если
+        совпадает размер и либо время изменения, либо идентификатор blob Git.
+
         Args:
-            repo_path: Путь к репозиторию
-            context: Контекст репозитория
-            incremental: Инкрементальное обновление
+            candidates: Файлы-кандидаты, собранные _scan_repository
+            previous_files: Записи предыдущего индекса по относительному пути
+            max_parse_bytes: Размер файла, начиная с которого AST не разбирается
 
         Returns:
             Список индексированных файлов
         """
-        files = []
-        repo_path = Path(repo_path)
+        files: List[Optional[IndexedFile]] = []
+        pending = []
+        for path, relpath, stat, blob_id in candidates:
+            previous = previous_files.get(relpath)
+            if previous is not None and previous.size_bytes == stat.st_size:
+                same_mtime = previous.mtime_ns == stat.st_mtime_ns
+                same_blob = blob_id is not None and previous.git_blob_id == blob_id
+                if same_mtime or same_blob:
+                    # Запись дополняется недостающим признаком, чтобы следующий
+                    # запуск узнал файл по любому из них
+                    update: Dict[str, Any] = {}
+                    if not same_mtime:
+                        update["last_modified_epoch"] = stat.st_mtime
+                        update["mtime_ns"] = stat.st_mtime_ns
+                    if blob_id is not None and not same_blob:
+                        update["git_blob_id"] = blob_id
+                    files.append(previous.model_copy(update=update) if update else previous)
+                    continue
+
+            pending.append((len(files), path, relpath, stat, blob_id))
+            files.append(None)
+
+        if previous_files:
+            logger.info(
+                f"Инкрементальная индексация: {len(files) - len(pending)} файлов без изменений, "
+                f"{len(pending)} к обработке"
+            )
 
-        # Паттерны для поиска
-        include_patterns = context.include_patterns or ["**/*.py"]
-        exclude_patterns = context.exclude_patterns or [
-            "**/__pycache__/**",
-            "**/.git/**",
-            "**/node_modules/**",
-            "**/venv/**",
-            "**/.venv/**",
-        ]
-
-        # Поиск файлов
-        all_files = []
-        for pattern in include_patterns:
-            all_files.extend(repo_path.rglob(pattern))
-
-        # Фильтрация
-        for file_path in all_files:
-            if not file_path.is_file():
-                continue
+        paths = [path for _, path, _, _, _ in pending]
+        if len(paths) < _PARALLEL_MIN_FILES:
+            results = [_index_file_worker(path, max_parse_bytes) for path in paths]
+        else:
+            results = self._index_parallel(paths, max_parse_bytes)
 
-            # Проверка исключений
-            if any(
-                self._match_pattern(str(file_path.relative_to(repo_path)), pattern)
-                for pattern in exclude_patterns
-            ):
+        for (position, path, relpath, stat, blob_id), data in zip(pending, results):
+            if data is None:
                 continue
-
-            # Индексация файла
             try:
-                indexed_file = self._index_file(file_path, repo_path)
-                if indexed_file:
-                    files.append(indexed_file)
+                files[position] = IndexedFile(
+                    path=Path(relpath),
+                    last_modified_epoch=stat.st_mtime,
+                    mtime_ns=stat.st_mtime_ns,
+                    git_blob_id=blob_id,
+                    **data,
+                )
             except Exception as e:
-                logger.warning(f"Ошибка индексации файла {file_path}: {e}")
+                logger.warning(f"Ошибка индексации файла {path}: {e}")
 
-        return files
+        return [f for f in files if f is not None]
 
-    def _index_file(self, file_path: Path, repo_path: Path) -> Optional[IndexedFile]:
+    @staticmethod
+    def _index_parallel(
+        paths: List[str], max_parse_bytes: int
+    ) -> List[Optional[Dict[str, Any]]]:
         """
-        Индексирует один файл.
+        Индексирует файлы в пуле процессов.
+
+        Используются процессы, а не потоки: ast.parse удерживает GIL.
 
         Args:
-            file_path: Путь к файлу
-            repo_path: Корневой путь репозитория
+            paths: Абсолютные пути к файлам
+            max_parse_bytes: Размер файла, начиная с которого AST не разбирается
 
         Returns:
-            Индексированный файл или None
+            Результаты _index_file_worker в порядке paths
         """
         try:
-            # Чтение содержимого
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-
-            # Определение типа файла
-            file_type = self._determine_file_type(file_path, content)
-
-            # Хеш содержимого
-            content_hash = hashlib.md5(content.encode("utf-8")).hexdigest()
-
-            # Парсинг AST для извлечения информации
-            imports, classes, functions = self._parse_ast(content)
-
-            # Относительный путь
-            relative_path = file_path.relative_to(repo_path)
-
-            # Время модификации
-            stat = file_path.stat()
-            last_modified = datetime.fromtimestamp(stat.st_mtime)
-
-            return IndexedFile(
-                path=relative_path,
-                file_type=file_type,
-                content_hash=content_hash,
-                size_bytes=len(content.encode("utf-8")),
-                last_modified=last_modified,
-                imports=imports,
-                classes=classes,
-                functions=functions,
-            )
-
-        except Exception as e:
-            logger.debug(f"Ошибка индексации файла {file_path}: {e}")
-            return None
-
-    def _determine_file_type(self, file_path: Path, content: str) -> FileType:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = list(
+                    executor.map(
+                        _index_file_worker,
+                        paths,
+                        repeat(max_parse_bytes),
+                        chunksize=_WORKER_CHUNKSIZE,
+                    )
+                )
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning(f"Пул процессов недоступен, индексация выполняется последовательно: {e}")
+            return [_index_file_worker(path, max_parse_bytes) for path in paths]
+
+        # Строки из дочерних процессов приходят копиями: интернируем повторно
+        for data in results:
+            if data is not None:
+                for key in ("imports", "classes", "functions"):
+                    data[key] = [intern(name) for name in data[key]]
+        return results
+
+    @staticmethod
+    def _determine_file_type(file_path: Path, content: str) -> FileType:
         """
         Определяет тип файла.
 
@@ -257,29 +544,32 @@ class RepositoryIndexer:
         Returns:
             Тип файла
         """
-        name = file_path.name.lower()
-        path_str = str(file_path).lower()
+        # Альтернативы проверяются по порядку с начала имени, поэтому приоритет
+        # тест > фикстура > конфигурация сохраняется
+        match = _FILE_NAME_TYPE_RE.match(file_path.name)
+        kind = match.lastgroup if match else None
 
         # Тестовые файлы
-        if "test_" in name or name.startswith("test") or "_test.py" in name:
+        if kind == "test":
             return FileType.TEST
 
-        # Page Objects
-        if "page" in path_str or "page_object" in path_str:
+        # Page Objects: содержимое проверяется только для подходящих путей
+        if _PAGE_PATH_RE.search(str(file_path)):
             if "class" in content and "BasePage" in content:
                 return FileType.PAGE_OBJECT
 
         # Фикстуры
-        if name == "conftest.py" or "fixture" in name:
+        if kind == "fixture":
             return FileType.FIXTURE
 
         # Конфигурационные файлы
-        if name in ["pytest.ini", "setup.cfg", "pyproject.toml", "requirements.txt"]:
+        if kind == "config":
             return FileType.CONFIG
 
         return FileType.OTHER
 
-    def _parse_ast(self, content: str) -> tuple[List[str], List[str], List[str]]:
+    @staticmethod
+    def _parse_ast(content: str) -> tuple[List[str], List[str], List[str]]:
         """
         Парсит AST для извлечения информации о коде.
 
@@ -289,47 +579,227 @@ class RepositoryIndexer:
         Returns:
             Кортеж (импорты, классы, функции)
         """
-        imports = []
-        classes = []
-        functions = []
-
+        visitor = _IndexVisitor()
         try:
-            tree = ast.parse(content)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        imports.append(alias.name)
-                elif isinstance(node, ast.ImportFrom):
-                    module = node.module or ""
-                    for alias in node.names:
-                        imports.append(f"{module}.{alias.name}" if module else alias.name)
-                elif isinstance(node, ast.ClassDef):
-                    classes.append(node.name)
-                elif isinstance(node, ast.FunctionDef):
-                    functions.append(node.name)
+            # compile напрямую: без обертки ast.parse и наследования флагов __future__
+            tree = compile(content, "<index>", "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+            visitor.visit(tree)
         except SyntaxError:
             # Игнорируем синтаксические ошибки
             pass
 
-        return imports, classes, functions
+        return visitor.imports, visitor.classes, visitor.functions
+
+    @staticmethod
+    def _compile_include_patterns(patterns: List[str]) -> Pattern[str]:
+        """
+        Компилирует паттерны включения в одно регулярное выражение.
+
+        Семантика совпадает с Path.rglob(pattern): паттерн сопоставляется
+        с хвостом относительного пути по сегментам, "*" и "?" не выходят
+        за пределы сегмента, "**" соответствует любому числу директорий.
+        Паттерны, оканчивающиеся на "**", выбирают только директории
+        и файлов не включают.
+
+        Args:
+            patterns: Паттерны включения
+
+        Returns:
+            Скомпилированное регулярное выражение
+        """
+        parts = []
+        for pattern in patterns:
+            segments = [segment for segment in pattern.replace("\\", "/").split("/") if segment]
+            if not segments or segments[-1] == "**":
+                continue
+            parts.append(
+                "".join(
+                    "(?:[^/]+/)*" if segment == "**" else _translate_glob_segment(segment) + "/"
+                    for segment in segments
+                )[:-1]
+            )
+        if not parts:
+            # Ни один паттерн не выбирает файлы
+            return re.compile(r"(?!)")
+        return re.compile(r"(?:[^/]+/)*(?:" + "|".join(parts) + r")\Z", re.DOTALL)
 
-    def _match_pattern(self, path: str, pattern: str) -> bool:
+    @staticmethod
+    def _partition_exclude_patterns(patterns: List[str]) -> Tuple[FrozenSet[str], List[str]]:
         """
-        Проверяет соответствие пути паттерну.
+        Разделяет паттерны исключения на имена директорий и glob-паттерны.
+
+        Паттерн вида "**/<dir>/**" исключает файлы, у которых один из сегментов
+        пути равен <dir>, и проверяется поиском в множестве. Служебные
+        директории (_PRUNED_DIRS) отсекаются еще при обходе.
 
         Args:
-            path: Путь для проверки
-            pattern: Паттерн (поддерживает **)
+            patterns: Паттерны исключения
 
         Returns:
-            True если соответствует
+            Кортеж (имена директорий, остальные glob-паттерны)
+        """
+        segments = set()
+        globs = []
+        for pattern in patterns:
+            match = _SEGMENT_PATTERN_RE.fullmatch(pattern.replace("\\", "/"))
+            if match:
+                segments.add(match.group(1))
+            else:
+                globs.append(pattern)
+        return frozenset(segments - _PRUNED_DIRS), globs
+
+    @staticmethod
+    def _compile_exclude_patterns(patterns: List[str]) -> Optional[Pattern[str]]:
         """
-        # Простая реализация с поддержкой **
-        import fnmatch
+        Компилирует паттерны исключения в одно регулярное выражение.
 
-        # Нормализация путей
-        path = path.replace("\\", "/")
-        pattern = pattern.replace("\\", "/")
+        Args:
+            patterns: Паттерны исключения (поддерживают **)
 
-        return fnmatch.fnmatch(path, pattern)
+        Returns:
+            Скомпилированное выражение или None, если паттернов нет
+        """
+        if not patterns:
+            return None
+        parts = [fnmatch.translate(pattern.replace("\\", "/")) for pattern in patterns]
+        return re.compile("|".join(f"(?:{part})" for part in parts))
+
+
+def _translate_glob_segment(segment: str) -> str:
+    """
+    Переводит один сегмент glob-паттерна в регулярное выражение.
+
+    В отличие от fnmatch.translate, "*", "?" и классы символов не совпадают с "/".
+
+    Args:
+        segment: Сегмент паттерна без "/"
+
+    Returns:
+        Регулярное выражение для сегмента
+    """
+    result = []
+    i, n = 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            result.append("[^/]*")
+        elif c == "?":
+            result.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and segment[j] == "!":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                result.append("\\[")
+                continue
+            chars = segment[i:j].replace("\\", "\\\\")
+            i = j + 1
+            # Символы, которые re внутри класса трактует особо
+            negated = chars[0] == "!"
+            chars = re.sub(r"([\[\]&~|^])", r"\\\1", chars[1:] if negated else chars)
+            result.append(f"[^/{chars}]" if negated else f"[{chars}]")
+        else:
+            result.append(re.escape(c))
+    return "".join(result)
+
+
+def _walk_order_key(relpath: str) -> Tuple[Tuple[str, ...], str]:
+    """
+    Ключ сортировки, воспроизводящий порядок обхода _walk.
+
+    Args:
+        relpath: Относительный путь через "/"
+
+    Returns:
+        Кортеж (сегменты директории, имя)
+    """
+    *dir_parts, name = relpath.split("/")
+    return tuple(dir_parts), name
+
+
+def _hash_content(raw: bytes) -> str:
+    """
+    Вычисляет хеш содержимого для отслеживания изменений.
+
+    Используется blake3 или xxhash, если установлены, иначе MD5 из hashlib.
+
+    Args:
+        raw: Содержимое файла
+
+    Returns:
+        Хеш в шестнадцатеричном виде
+    """
+    if _fast_hash is not None:
+        return _fast_hash(raw).hexdigest()
+    return hashlib.md5(raw, usedforsecurity=False).hexdigest()
+
+
+def _index_file_worker(path: str, max_parse_bytes: int) -> Optional[Dict[str, Any]]:
+    """
+    Индексирует один файл (выполняется в том числе в дочерних процессах).
+
+    Для пустых файлов и файлов больше max_parse_bytes (сгенерированный код и т.п.)
+    AST не разбирается: сохраняются тип, размер и хеш.
+
+    Args:
+        path: Абсолютный путь к файлу
+        max_parse_bytes: Размер файла, начиная с которого AST не разбирается
+
+    Returns:
+        Поля IndexedFile без path и времени изменения или None при ошибке
+    """
+    file_path = Path(path)
+    try:
+        # Чтение содержимого: хеш и размер считаются по исходным байтам,
+        # декодирование выполняется один раз
+        raw = file_path.read_bytes()
+
+        # Хеш содержимого
+        content_hash = _hash_content(raw)
+
+        imports: List[str] = []
+        classes: List[str] = []
+        functions: List[str] = []
+
+        if file_path.name.lower() in _CONFIG_FILE_NAMES:
+            # Конфигурационные файлы не декодируются и не разбираются
+            file_type = FileType.CONFIG
+        elif not raw or len(raw) > max_parse_bytes:
+            # Содержимое нужно для классификации только на путях Page Object;
+            # остальные большие файлы не декодируются
+            content = (
+                raw.decode("utf-8", errors="ignore") if _PAGE_PATH_RE.search(str(file_path)) else ""
+            )
+            file_type = RepositoryIndexer._determine_file_type(file_path, content)
+            if raw:
+                logger.debug(
+                    f"Файл {file_path} ({len(raw)} байт) превышает {max_parse_bytes} байт, "
+                    f"разбор AST пропущен"
+                )
+        else:
+            content = raw.decode("utf-8", errors="ignore")
 
+            # Определение типа файла
+            file_type = RepositoryIndexer._determine_file_type(file_path, content)
+
+            # Парсинг AST только для исходного кода Python
+            if file_path.suffix == ".py" and file_type != FileType.CONFIG:
+                imports, classes, functions = RepositoryIndexer._parse_ast(content)
+
+        return {
+            "file_type": file_type,
+            "content_hash": content_hash,
+            "size_bytes": len(raw),
+            "imports": imports,
+            "classes": classes,
+            "functions": functions,
+        }
+
+    except Exception as e:
+        logger.debug(f"Ошибка индексации файла {file_path}: {e}")
+        return None
@@ -1,12 +1,31 @@
 """Модели для индексации репозитория."""
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+import time
+from functools import cached_property
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+from typing import List, Optional, Dict, Any, FrozenSet, Iterator, Tuple, Union
 from pathlib import Path
 from datetime import datetime
 from enum import Enum
 
 
+def _to_epoch(value: Union[None, float, int, str, datetime]) -> Optional[float]:
+    """
+    Приводит время из индексов старого формата (datetime или ISO строка) к Unix time.
+
+    Args:
+        value: Значение времени
+
+    Returns:
+        Время в секундах с начала эпохи или None
+    """
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.timestamp()
+
+
 class FileType(str, Enum):
     """Тип файла в репозитории."""
 
@@ -24,11 +43,47 @@ class IndexedFile(BaseModel):
     file_type: FileType = Field(..., description="Тип файла")
     content_hash: str = Field(..., description="Хеш содержимого для отслеживания изменений")
     size_bytes: int = Field(..., description="Размер файла в байтах")
-    last_modified: Optional[datetime] = Field(default=None, description="Время последнего изменения")
+    last_modified_epoch: Optional[float] = Field(
+        default=None, description="Время последнего изменения (Unix time)"
+    )
+    mtime_ns: Optional[int] = Field(
+        default=None, description="Время изменения в наносекундах (для инкрементальной индексации)"
+    )
+    git_blob_id: Optional[str] = Field(
+        default=None,
+        description="Идентификатор blob Git (для инкрементальной индексации новой рабочей копии)",
+    )
     imports: List[str] = Field(default_factory=list, description="Список импортов")
     classes: List[str] = Field(default_factory=list, description="Список классов")
     functions: List[str] = Field(default_factory=list, description="Список функций")
 
+    @model_validator(mode="before")
+    @classmethod
+    def _migrate_last_modified(cls, data: Any) -> Any:
+        """Принимает поле last_modified из индексов старого формата."""
+        if isinstance(data, dict) and "last_modified" in data:
+            data = dict(data)
+            last_modified = data.pop("last_modified")
+            data.setdefault("last_modified_epoch", _to_epoch(last_modified))
+        return data
+
+    @property
+    def last_modified(self) -> Optional[datetime]:
+        """Время последнего изменения."""
+        if self.last_modified_epoch is None:
+            return None
+        return datetime.fromtimestamp(self.last_modified_epoch)
+
+    @cached_property
+    def imports_blob(self) -> str:
+        """Импорты одной строкой (по одному на строку) для поиска подстрок."""
+        return "\n".join(self.imports)
+
+    @cached_property
+    def imports_set(self) -> FrozenSet[str]:
+        """Множество импортов для проверки вхождения."""
+        return frozenset(self.imports)
+
 
 class ProjectStructure(BaseModel):
     """Структура проекта."""
@@ -88,7 +143,9 @@ class RepositoryIndex(BaseModel):
     # Метаданные
     repository_url: Optional[str] = Field(default=None, description="URL репозитория")
     repository_path: Optional[Path] = Field(default=None, description="Локальный путь")
-    indexed_at: datetime = Field(default_factory=datetime.now, description="Время индексации")
+    indexed_at_epoch: float = Field(
+        default_factory=time.time, description="Время индексации (Unix time)"
+    )
     version: str = Field(default="1.0", description="Версия индекса")
 
     # Структура
@@ -111,13 +168,74 @@ class RepositoryIndex(BaseModel):
     test_files_count: int = Field(default=0, description="Количество тестовых файлов")
     page_object_files_count: int = Field(default=0, description="Количество Page Object файлов")
 
+    # Файлы, сгруппированные по типу, и список с длиной, по которому
+    # построена группировка (не сериализуются)
+    _files_by_type: Dict[FileType, List[IndexedFile]] = PrivateAttr(default_factory=dict)
+    _grouped_files: Optional[Tuple[List[IndexedFile], int]] = PrivateAttr(default=None)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _migrate_indexed_at(cls, data: Any) -> Any:
+        """Принимает поле indexed_at из индексов старого формата."""
+        if isinstance(data, dict) and "indexed_at" in data:
+            data = dict(data)
+            indexed_at = data.pop("indexed_at")
+            if indexed_at is not None:
+                data.setdefault("indexed_at_epoch", _to_epoch(indexed_at))
+        return data
+
+    @model_validator(mode="after")
+    def _group_files_by_type(self) -> "RepositoryIndex":
+        """Группирует файлы по типу при создании индекса."""
+        self._get_files_by_type()
+        return self
+
+    def _get_files_by_type(self) -> Dict[FileType, List[IndexedFile]]:
+        """
+        Возвращает файлы, сгруппированные по типу.
+
+        Группировка перестраивается, если список files заменен или изменилась
+        его длина (добавление, удаление). Замена элементов на месте без
+        изменения длины не отслеживается: для этого нужно присвоить files
+        новый список.
+
+        Returns:
+            Словарь тип файла -> файлы в порядке индекса
+        """
+        files = self.files
+        grouped = self._grouped_files
+        if grouped is None or grouped[0] is not files or grouped[1] != len(files):
+            files_by_type: Dict[FileType, List[IndexedFile]] = {}
+            for f in files:
+                files_by_type.setdefault(f.file_type, []).append(f)
+            self._files_by_type = files_by_type
+            self._grouped_files = (files, len(files))
+        return self._files_by_type
+
+    @property
+    def indexed_at(self) -> datetime:
+        """Время индексации."""
+        return datetime.fromtimestamp(self.indexed_at_epoch)
+
+    def iter_by_type(self, file_type: FileType) -> Iterator[IndexedFile]:
+        """
+        Итерирует по файлам указанного типа без построения нового списка.
+
+        Args:
+            file_type: Тип файла
+
+        Returns:
+            Итератор по файлам в порядке индекса
+        """
+        return iter(self._get_files_by_type().get(file_type, ()))
+
     def get_test_files(self) -> List[IndexedFile]:
         """Возвращает список тестовых файлов."""
-        return [f for f in self.files if f.file_type == FileType.TEST]
+        return list(self.iter_by_type(FileType.TEST))
 
     def get_page_object_files(self) -> List[IndexedFile]:
         """Возвращает список Page Object файлов."""
-        return [f for f in self.files if f.file_type == FileType.PAGE_OBJECT]
+        return list(self.iter_by_type(FileType.PAGE_OBJECT))
 
     def get_example_code(self, file_type: FileType, limit: int = 3) -> List[str]:
         """
@@ -130,6 +248,6 @@ class RepositoryIndex(BaseModel):
         Returns:
             Список путей к файлам-примерам
         """
-        files = [f for f in self.files if f.file_type == file_type]
+        files = self._get_files_by_type().get(file_type, [])
         return [str(f.path) for f in files[:limit]]
 
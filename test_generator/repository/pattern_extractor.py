@@ -1,14 +1,143 @@
 """Извлечение паттернов из репозитория."""
 
 import re
-from typing import List, Set
-
-from test_generator.repository.models import RepositoryIndex, NamingPattern, CodePatterns
+from collections import Counter
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+from test_generator.repository.models import (
+    RepositoryIndex,
+    NamingPattern,
+    CodePatterns,
+    FileType,
+)
 from test_generator.repository.indexer import RepositoryIndexer
 from test_generator.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Маркеры в импортах (по одному на строку): qautils (gpn_qa_utils, в том числе
+# gpn_qa_utils.ui.pages и gpn_qa_utils.ui.page_factory), базовый класс Page,
+# BrowserLauncher и Allure (импорт начинается с allure)
+_MARKER_EXPRESSIONS = (
+    ("qautils", r"gpn_qa_utils|qautils"),
+    ("base_page", r"BasePage"),
+    ("launcher", r"BrowserLauncher"),
+    ("allure", r"^allure"),
+)
+_MARKER_RE = re.compile(
+    "|".join(f"(?P<{name}>{expression})" for name, expression in _MARKER_EXPRESSIONS),
+    re.MULTILINE,
+)
+
+
+def _compile_hyperscan_markers() -> Optional[Any]:
+    """
+    Компилирует маркеры в базу Hyperscan, если он установлен.
+
+    Returns:
+        База Hyperscan или None (используется регулярное выражение re)
+    """
+    if hyperscan is None:
+        return None
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[expression.encode() for _, expression in _MARKER_EXPRESSIONS],
+            ids=list(range(len(_MARKER_EXPRESSIONS))),
+            elements=len(_MARKER_EXPRESSIONS),
+            # Каждый маркер достаточно найти один раз за сканирование
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_MULTILINE]
+            * len(_MARKER_EXPRESSIONS),
+        )
+        return database
+    except Exception as e:
+        logger.debug("Hyperscan недоступен, используется re: %s", e)
+        return None
+
+
+_HYPERSCAN_MARKERS = _compile_hyperscan_markers()
+
+
+def _on_hyperscan_match(
+    marker_id: int, start: int, end: int, flags: int, found: Set[str]
+) -> None:
+    """Запоминает найденный Hyperscan маркер."""
+    found.add(_MARKER_EXPRESSIONS[marker_id][0])
+
+
+def _find_markers(text: str) -> Set[str]:
+    """
+    Находит маркеры в тексте импортов.
+
+    Args:
+        text: Импорты файла, по одному на строку
+
+    Returns:
+        Имена найденных маркеров
+    """
+    if _HYPERSCAN_MARKERS is not None:
+        found: Set[str] = set()
+        _HYPERSCAN_MARKERS.scan(
+            text.encode("utf-8"), match_event_handler=_on_hyperscan_match, context=found
+        )
+        return found
+    return {match.lastgroup for match in _MARKER_RE.finditer(text)}
+
+
+# Правила определения стиля именования: (стиль, проверка), по порядку
+_HAS_UNDERSCORE = re.compile(r"_").search
+
+
+def _starts_upper(name: str) -> bool:
+    """Имя начинается с заглавной буквы (любого алфавита)."""
+    return name[:1].isupper()
+
+
+def _is_pascal_case(name: str) -> bool:
+    """Имя начинается с заглавной буквы и не содержит подчеркиваний."""
+    return _starts_upper(name) and "_" not in name
+
+
+def _has_inner_upper(name: str) -> bool:
+    """В имени есть заглавная буква не на первой позиции."""
+    return any(c.isupper() for c in name[1:])
+
+
+_FILE_NAMING_RULES = (
+    ("snake_case", _HAS_UNDERSCORE),
+    ("kebab-case", re.compile(r"-").search),
+    ("lowercase", str.islower),
+)
+_CLASS_NAMING_RULES = (
+    ("PascalCase", _is_pascal_case),
+    ("Pascal_Case", _starts_upper),
+)
+_FUNCTION_NAMING_RULES = (
+    ("snake_case", _HAS_UNDERSCORE),
+    ("PascalCase", _starts_upper),
+)
+
+# Стили, которые имя из одного слова получает по умолчанию: такие имена
+# подходят под несколько стилей сразу, поэтому в голосовании не участвуют
+# (например, run - и snake_case, и camelCase; Page - и PascalCase, и Pascal_Case)
+_AMBIGUOUS_FILE_STYLE = "lowercase"
+_AMBIGUOUS_CLASS_STYLE = "PascalCase"
+_AMBIGUOUS_FUNCTION_STYLE = "camelCase"
+
+
+# Маркер -> (поле CodePatterns, значение)
+_MARKER_FIELDS = {
+    "qautils": ("uses_qautils", True),
+    "base_page": ("base_page_class", "BasePage"),
+    "launcher": ("browser_launcher", "BrowserLauncher"),
+    "allure": ("uses_allure", True),
+}
+
 
 class PatternExtractor:
     """Извлечение паттернов и шаблонов из индекса."""
@@ -25,169 +154,160 @@ class PatternExtractor:
         """
         logger.info("Извлечение паттернов из индекса...")
 
-        # Извлечение паттернов именования
-        naming_patterns = self._extract_naming_patterns(index)
-        index.naming_patterns = naming_patterns
-
-        # Извлечение паттернов кода
-        code_patterns = self._extract_code_patterns(index)
-        index.code_patterns = code_patterns
-
-        logger.info("Паттерны извлечены")
-        return index
-
-    def _extract_naming_patterns(self, index: RepositoryIndex) -> NamingPattern:
-        """
-        Извлекает паттерны именования.
-
-        Args:
-            index: Индекс репозитория
-
-        Returns:
-            Паттерны именования
-        """
-        patterns = NamingPattern()
-
-        # Анализ имен файлов
-        file_names = [f.path.name for f in index.files if f.path.suffix == ".py"]
-        if file_names:
-            patterns.file_naming = self._detect_naming_style(file_names[0])
-
-        # Анализ имен классов
-        all_classes = []
-        for file in index.files:
-            all_classes.extend(file.classes)
-
-        if all_classes:
-            patterns.class_naming = self._detect_class_naming_style(all_classes[0])
+        naming_patterns = NamingPattern()
+        code_patterns = CodePatterns()
+
+        # Все данные собираются за один проход по файлам индекса
+        file_styles: Counter = Counter()
+        class_styles: Counter = Counter()
+        function_styles: Counter = Counter()
+        first_file: Optional[str] = None
+        first_class: Optional[str] = None
+        first_function: Optional[str] = None
+        test_functions: List[str] = []
+        page_classes: List[str] = []
+        import_counts: Counter = Counter()
+        pending_markers = set(_MARKER_FIELDS)
 
-        # Анализ имен функций
-        all_functions = []
         for file in index.files:
-            all_functions.extend(file.functions)
-
-        if all_functions:
-            patterns.function_naming = self._detect_function_naming_style(all_functions[0])
+            imports = file.imports
+
+            # Стили именования учитываются по всем однозначным именам, а не по первому
+            if file.path.suffix == ".py":
+                first_file = first_file or file.path.name
+                file_styles.update(self._vote_file_naming_styles((file.path.name,)))
+            if file.classes:
+                first_class = first_class or file.classes[0]
+                class_styles.update(self._vote_class_naming_styles(file.classes))
+            if file.functions:
+                first_function = first_function or file.functions[0]
+                function_styles.update(self._vote_function_naming_styles(file.functions))
+
+            if file.file_type == FileType.TEST:
+                test_functions.extend(f for f in file.functions if "test" in f.lower())
+            elif file.file_type == FileType.PAGE_OBJECT:
+                page_classes.extend(c for c in file.classes if "page" in c.lower())
+
+            # Детекторы отключаются после первого срабатывания; все маркеры
+            # ищутся одним сканированием импортов файла
+            if pending_markers and imports:
+                for marker in _find_markers(file.imports_blob) & pending_markers:
+                    field, value = _MARKER_FIELDS[marker]
+                    setattr(code_patterns, field, value)
+                    pending_markers.discard(marker)
+
+            # Частота импортов
+            import_counts.update(imports)
+
+        # Паттерны именования: преобладающий стиль среди однозначных имен,
+        # а если таких нет - стиль первого имени
+        if first_file is not None:
+            naming_patterns.file_naming = _pick_style(
+                file_styles, first_file, self._detect_naming_style
+            )
+        if first_class is not None:
+            naming_patterns.class_naming = _pick_style(
+                class_styles, first_class, self._detect_class_naming_style
+            )
+        if first_function is not None:
+            naming_patterns.function_naming = _pick_style(
+                function_styles, first_function, self._detect_function_naming_style
+            )
 
         # Определение префикса тестов
-        test_functions = []
-        for file in index.get_test_files():
-            test_functions.extend([f for f in file.functions if "test" in f.lower()])
-
         if test_functions:
             # Ищем общий префикс
             prefixes = ["test_", "test", "test_"]
             for prefix in prefixes:
                 if any(f.startswith(prefix) for f in test_functions):
-                    patterns.test_prefix = prefix
+                    naming_patterns.test_prefix = prefix
                     break
 
         # Определение суффикса Page Objects
-        page_classes = []
-        for file in index.get_page_object_files():
-            page_classes.extend([c for c in file.classes if "page" in c.lower()])
-
         if page_classes:
             # Ищем общий суффикс
             suffixes = ["Page", "PageObject", "PO"]
             for suffix in suffixes:
                 if any(c.endswith(suffix) for c in page_classes):
-                    patterns.page_suffix = suffix
-                    break
-
-        return patterns
-
-    def _extract_code_patterns(self, index: RepositoryIndex) -> CodePatterns:
-        """
-        Извлекает паттерны кода.
-
-        Args:
-            index: Индекс репозитория
-
-        Returns:
-            Паттерны кода
-        """
-        patterns = CodePatterns()
-
-        # Проверка использования qautils
-        qautils_imports = [
-            "gpn_qa_utils",
-            "qautils",
-            "gpn_qa_utils.ui",
-            "gpn_qa_utils.ui.pages",
-            "gpn_qa_utils.ui.page_factory",
-        ]
-
-        for file in index.files:
-            for imp in file.imports:
-                if any(qa_import in imp for qa_import in qautils_imports):
-                    patterns.uses_qautils = True
+                    naming_patterns.page_suffix = suffix
                     break
 
-            # Поиск базового класса Page
-            if "BasePage" in " ".join(file.imports):
-                patterns.base_page_class = "BasePage"
-
-            # Поиск BrowserLauncher
-            if "BrowserLauncher" in " ".join(file.imports):
-                patterns.browser_launcher = "BrowserLauncher"
-
-        # Проверка использования Allure
-        allure_imports = ["allure", "allure_commons"]
-        for file in index.files:
-            if any(imp.startswith("allure") for imp in file.imports):
-                patterns.uses_allure = True
-                break
-
-        # Часто используемые импорты
-        import_counts = {}
-        for file in index.files:
-            for imp in file.imports:
-                import_counts[imp] = import_counts.get(imp, 0) + 1
-
         # Топ-10 импортов
-        common_imports = sorted(import_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        patterns.common_imports = [imp for imp, _ in common_imports]
+        code_patterns.common_imports = [imp for imp, _ in import_counts.most_common(10)]
 
-        # Поиск декораторов
-        decorators = set()
-        for file in index.files:
-            # Простой поиск декораторов в содержимом
-            # В реальности нужно парсить AST более детально
-            if "@" in str(file.path):
-                # Это упрощение, в реальности нужно анализировать код
-                pass
+        # Декораторы в индексе не сохраняются
+        code_patterns.common_decorators = []
 
-        patterns.common_decorators = list(decorators)
+        index.naming_patterns = naming_patterns
+        index.code_patterns = code_patterns
 
-        return patterns
+        logger.info("Паттерны извлечены")
+        return index
 
     def _detect_naming_style(self, name: str) -> str:
         """Определяет стиль именования файла."""
-        if "_" in name:
-            return "snake_case"
-        elif "-" in name:
-            return "kebab-case"
-        elif name.islower():
-            return "lowercase"
-        else:
-            return "mixed"
+        return _classify_name(name, _FILE_NAMING_RULES, "mixed")
 
     def _detect_class_naming_style(self, name: str) -> str:
         """Определяет стиль именования класса."""
-        if name[0].isupper() and "_" not in name:
-            return "PascalCase"
-        elif name[0].isupper() and "_" in name:
-            return "Pascal_Case"
-        else:
-            return "mixed"
+        return _classify_name(name, _CLASS_NAMING_RULES, "mixed")
 
     def _detect_function_naming_style(self, name: str) -> str:
         """Определяет стиль именования функции."""
-        if "_" in name:
-            return "snake_case"
-        elif name[0].isupper():
-            return "PascalCase"
-        else:
-            return "camelCase"
-
+        return _classify_name(name, _FUNCTION_NAMING_RULES, "camelCase")
+
+    def _vote_file_naming_styles(self, names: Iterable[str]) -> Iterator[str]:
+        """Стили однозначных имен файлов."""
+        for name in names:
+            style = self._detect_naming_style(name)
+            if style != _AMBIGUOUS_FILE_STYLE:
+                yield style
+
+    def _vote_class_naming_styles(self, names: Iterable[str]) -> Iterator[str]:
+        """Стили однозначных имен классов."""
+        for name in names:
+            style = self._detect_class_naming_style(name)
+            if style != _AMBIGUOUS_CLASS_STYLE or _has_inner_upper(name):
+                yield style
+
+    def _vote_function_naming_styles(self, names: Iterable[str]) -> Iterator[str]:
+        """Стили однозначных имен функций."""
+        for name in names:
+            style = self._detect_function_naming_style(name)
+            if style != _AMBIGUOUS_FUNCTION_STYLE or _has_inner_upper(name):
+                yield style
+
+
+def _pick_style(votes: Counter, first_name: str, detect: Callable[[str], str]) -> str:
+    """
+    Выбирает стиль именования по результатам голосования.
+
+    Args:
+        votes: Количество однозначных имен каждого стиля
+        first_name: Первое имя (используется, если однозначных имен нет)
+        detect: Функция определения стиля одного имени
+
+    Returns:
+        Преобладающий стиль
+    """
+    if votes:
+        return votes.most_common(1)[0][0]
+    return detect(first_name)
+
+
+def _classify_name(name: str, rules: Tuple[Tuple[str, Callable[[str], Any]], ...], default: str) -> str:
+    """
+    Возвращает стиль первого сработавшего правила.
+
+    Args:
+        name: Имя для классификации
+        rules: Пары (стиль, проверка), проверяются по порядку
+        default: Стиль, если ни одно правило не сработало
+
+    Returns:
+        Стиль именования
+    """
+    for style, check in rules:
+        if check(name):
+            return style
+    return default
@@ -1,13 +1,70 @@
 """Анализ шаблонов из репозитория."""
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
-
-from test_generator.repository.models import RepositoryIndex, TemplateInfo, FileType
+from typing import Dict, Iterable, List, Set, Tuple
+
+from test_generator.repository.models import (
+    FileType,
+    IndexedFile,
+    RepositoryIndex,
+    TemplateInfo,
+)
 from test_generator.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Количество строк, которое берется из файла каждого вида
+_PAGE_OBJECT_TEMPLATE_LINES = 500
+_TEST_TEMPLATE_LINES = 300
+_FIXTURE_TEMPLATE_LINES = 200
+_SNIPPET_LINES = 100
+
+# Количество примеров каждого типа для общих фрагментов кода (не меньше 1:
+# первый пример также служит шаблоном)
+_SNIPPETS_PER_TYPE = 2
+
+# Максимум потоков для параллельного чтения файлов
+_MAX_READ_WORKERS = 4
+
+
+def _read_head_lines(path_str: str, n: int) -> List[str]:
+    """
+    Читает первые n строк файла вместе с концами строк.
+
+    Файл читается построчно, поэтому остаток большого файла
+    не загружается и не декодируется.
+
+    Args:
+        path_str: Путь к файлу
+        n: Количество строк
+
+    Returns:
+        Первые n строк файла
+    """
+    with open(path_str, "r", encoding="utf-8") as f:
+        return list(islice(f, n))
+
+
+def _join_head(lines: List[str], n: int) -> str:
+    """
+    Собирает первые n строк так же, как "\n".join(content.split("\n")[:n]).
+
+    Args:
+        lines: Начальные строки файла вместе с концами строк
+        n: Количество строк
+
+    Returns:
+        Текст первых n строк
+    """
+    head = "".join(lines[:n])
+    # Если строк не меньше n, последний перевод строки отделяет
+    # отброшенную часть файла и в результат не входит
+    if len(lines) >= n and head.endswith("\n"):
+        head = head[:-1]
+    return head
+
 
 class TemplateAnalyzer:
     """Анализ корпоративных шаблонов."""
@@ -25,144 +82,97 @@ class TemplateAnalyzer:
         """
         logger.info("Анализ шаблонов...")
 
-        templates = TemplateInfo()
-
-        # Анализ Page Object шаблонов
-        page_object_template = self._extract_page_object_template(index, repo_path)
-        templates.page_object_template = page_object_template
-
-        # Анализ тестовых шаблонов
-        test_template = self._extract_test_template(index, repo_path)
-        templates.test_template = test_template
-
-        # Анализ шаблонов фикстур
-        fixture_template = self._extract_fixture_template(index, repo_path)
-        templates.fixture_template = fixture_template
-
-        # Общие фрагменты кода
-        common_snippets = self._extract_common_snippets(index, repo_path)
-        templates.common_code_snippets = common_snippets
-
-        index.templates = templates
+        index.templates = self._build_templates(index, repo_path)
 
         logger.info("Шаблоны проанализированы")
         return index
 
-    def _extract_page_object_template(
-        self, index: RepositoryIndex, repo_path: Path
-    ) -> Optional[str]:
+    def _build_templates(self, index: RepositoryIndex, repo_path: Path) -> TemplateInfo:
         """
-        Извлекает шаблон Page Object класса.
-
-        Args:
-            index: Индекс репозитория
-            repo_path: Путь к репозиторию
+        Собирает шаблоны и фрагменты кода из файлов индекса.
 
-        Returns:
-            Шаблон Page Object или None
-        """
-        page_files = index.get_page_object_files()
-        if not page_files:
-            return None
-
-        # Берем первый Page Object файл как пример
-        example_file = page_files[0]
-        file_path = repo_path / example_file.path
-
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            # Возвращаем первые 500 строк как шаблон
-            lines = content.split("\n")
-            return "\n".join(lines[:500])
-        except Exception as e:
-            logger.warning(f"Ошибка чтения файла {file_path}: {e}")
-            return None
-
-    def _extract_test_template(self, index: RepositoryIndex, repo_path: Path) -> Optional[str]:
-        """
-        Извлекает шаблон тестового метода.
+        Сначала определяются все нужные чтения, затем они выполняются
+        параллельно, и из результатов собирается TemplateInfo.
 
         Args:
             index: Индекс репозитория
             repo_path: Путь к репозиторию
 
         Returns:
-            Шаблон теста или None
-        """
-        test_files = index.get_test_files()
-        if not test_files:
-            return None
-
-        # Берем первый тестовый файл как пример
-        example_file = test_files[0]
-        file_path = repo_path / example_file.path
-
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            # Возвращаем первые 300 строк как шаблон
-            lines = content.split("\n")
-            return "\n".join(lines[:300])
-        except Exception as e:
-            logger.warning(f"Ошибка чтения файла {file_path}: {e}")
-            return None
-
-    def _extract_fixture_template(
-        self, index: RepositoryIndex, repo_path: Path
-    ) -> Optional[str]:
+            Информация о шаблонах
         """
-        Извлекает шаблон фикстуры.
-
-        Args:
-            index: Индекс репозитория
-            repo_path: Путь к репозиторию
+        def first_files(file_type: FileType, n: int) -> List[IndexedFile]:
+            # Файлы берутся из группировки индекса: копируются только нужные первые
+            return list(islice(index.iter_by_type(file_type), n))
+
+        page_files = first_files(FileType.PAGE_OBJECT, _SNIPPETS_PER_TYPE)
+        test_files = first_files(FileType.TEST, _SNIPPETS_PER_TYPE)
+        fixture_files = first_files(FileType.FIXTURE, 1)
+
+        def read_key(file: IndexedFile, n: int) -> Tuple[str, int]:
+            return str(repo_path / file.path), n
+
+        # Первый файл каждого вида берется как шаблон
+        page_key = read_key(page_files[0], _PAGE_OBJECT_TEMPLATE_LINES) if page_files else None
+        test_key = read_key(test_files[0], _TEST_TEMPLATE_LINES) if test_files else None
+        fixture_key = (
+            read_key(fixture_files[0], _FIXTURE_TEMPLATE_LINES) if fixture_files else None
+        )
+
+        # Общие фрагменты: несколько примеров тестов и Page Object
+        snippet_keys = [
+            read_key(file, _SNIPPET_LINES)
+            for files in (test_files, page_files)
+            for file in files
+        ]
+
+        contents = self._read_files(
+            key for key in (page_key, test_key, fixture_key, *snippet_keys) if key is not None
+        )
 
-        Returns:
-            Шаблон фикстуры или None
-        """
-        fixture_files = [f for f in index.files if f.file_type == FileType.FIXTURE]
-        if not fixture_files:
-            return None
-
-        # Берем первый файл фикстур
-        example_file = fixture_files[0]
-        file_path = repo_path / example_file.path
-
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            # Возвращаем первые 200 строк как шаблон
-            lines = content.split("\n")
-            return "\n".join(lines[:200])
-        except Exception as e:
-            logger.warning(f"Ошибка чтения файла {file_path}: {e}")
-            return None
-
-    def _extract_common_snippets(
-        self, index: RepositoryIndex, repo_path: Path
-    ) -> List[str]:
+        templates = TemplateInfo()
+        templates.page_object_template = contents.get(page_key)
+        templates.test_template = contents.get(test_key)
+        templates.fixture_template = contents.get(fixture_key)
+        templates.common_code_snippets = [
+            contents[key] for key in snippet_keys if key in contents
+        ]
+        return templates
+
+    @staticmethod
+    def _read_files(keys: Iterable[Tuple[str, int]]) -> Dict[Tuple[str, int], str]:
         """
-        Извлекает общие фрагменты кода.
+        Читает начала файлов параллельно.
+
+        Каждый файл читается один раз на наибольшее нужное количество строк.
+        Чтение файлов - чистый ввод-вывод, поэтому задержки отдельных
+        файлов (например, на сетевых дисках) перекрываются.
 
         Args:
-            index: Индекс репозитория
-            repo_path: Путь к репозиторию
+            keys: Пары (путь к файлу, количество строк)
 
         Returns:
-            Список общих фрагментов кода
+            Словарь (путь, количество строк) -> содержимое; файлы,
+            которые не удалось прочитать, в словарь не попадают
         """
-        snippets = []
-
-        # Извлекаем примеры из разных типов файлов
-        for file_type in [FileType.TEST, FileType.PAGE_OBJECT]:
-            files = [f for f in index.files if f.file_type == file_type][:2]  # Берем 2 примера
-            for file in files:
+        line_counts: Dict[str, Set[int]] = {}
+        for path_str, n in keys:
+            line_counts.setdefault(path_str, set()).add(n)
+        if not line_counts:
+            return {}
+
+        contents: Dict[Tuple[str, int], str] = {}
+        with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(line_counts))) as executor:
+            futures = [
+                (path_str, counts, executor.submit(_read_head_lines, path_str, max(counts)))
+                for path_str, counts in line_counts.items()
+            ]
+            for path_str, counts, future in futures:
                 try:
-                    file_path = repo_path / file.path
-                    content = file_path.read_text(encoding="utf-8")
-                    # Берем первые 100 строк как пример
-                    lines = content.split("\n")[:100]
-                    snippets.append("\n".join(lines))
-                except Exception:
-                    pass
-
-        return snippets
-
+                    lines = future.result()
+                except Exception as e:
+                    logger.warning("Ошибка чтения файла %s: %s", path_str, e)
+                    continue
+                for n in counts:
+                    contents[path_str, n] = _join_head(lines, n)
+        return contents
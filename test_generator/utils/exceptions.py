@@ -28,6 +28,9 @@ class TestCaseParseError(TestGeneratorError):
 class LLMError(TestGeneratorError):
     """Базовое исключение для ошибок LLM."""
 
+    # Атрибуты в слотах: словарь атрибутов экземпляра не создается
+    __slots__ = ("error_type", "retryable", "original_error")
+
     def __init__(
         self,
         message: str,
@@ -40,10 +43,17 @@ class LLMError(TestGeneratorError):
         self.retryable = retryable
         self.original_error = original_error
 
+    def __reduce__(self):
+        # Значения слотов не входят в __dict__, поэтому передаются явно
+        state = {name: getattr(self, name) for name in LLMError.__slots__}
+        return self.__class__, self.args, state
+
 
 class LLMTimeoutError(LLMError):
     """Ошибка таймаута LLM."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "LLM request timeout", original_error: Exception = None):
         super().__init__(message, error_type="timeout", retryable=True, original_error=original_error)
 
@@ -51,6 +61,8 @@ class LLMTimeoutError(LLMError):
 class LLMTemporaryError(LLMError):
     """Временная ошибка LLM."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Temporary LLM error", original_error: Exception = None):
         super().__init__(message, error_type="temporary", retryable=True, original_error=original_error)
 
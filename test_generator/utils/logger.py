@@ -15,6 +15,8 @@ def setup_logger(
     """
     Настраивает логгер для библиотеки.
 
+    Повторный вызов с теми же параметрами не пересоздает обработчики.
+
     Args:
         name: Имя логгера
         level: Уровень логирования (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -27,8 +29,15 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
 
+    # Логгер уже настроен с этими же обработчиками
+    handlers_config = (log_file, format_string)
+    if getattr(logger, "_tg_handlers_config", None) == handlers_config:
+        return logger
+
     # Удаляем существующие обработчики
-    logger.handlers.clear()
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
 
     # Формат по умолчанию
     if format_string is None:
@@ -46,10 +55,12 @@ def setup_logger(
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        # Файл открывается при первой записи, а не при настройке
+        file_handler = logging.FileHandler(log_file, encoding="utf-8", delay=True)
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
 
+    logger._tg_handlers_config = handlers_config
     return logger
 
 
@@ -0,0 +1,184 @@
+"""Тесты пакетной генерации: один запрос к LLM на несколько тест-кейсов."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from test_generator.core.generator import TestGenerator
+from test_generator.llm import LLMProvider, PromptBuilder
+from test_generator.models import GenerationConfig, LLMConfig, TestCase
+
+
+def _test_case(test_case_id: str) -> TestCase:
+    return TestCase.model_validate(
+        {
+            "id": test_case_id,
+            "name": f"Проверка {test_case_id}",
+            "expectedResult": "Страница открыта",
+            "testLayer": "E2E",
+            "steps": [
+                {
+                    "id": "1",
+                    "name": "Шаг 1",
+                    "description": "Открыть страницу",
+                    "expectedResult": "Страница открыта",
+                }
+            ],
+        }
+    )
+
+
+def _answer_code(test_case_id: str) -> str:
+    return (
+        "```python\n"
+        "import allure\n"
+        "\n"
+        f"class Test{test_case_id}:\n"
+        f"    def test_{test_case_id.lower()}(self):\n"
+        "        assert True\n"
+        "```"
+    )
+
+
+def _batch_response(*answers: Any) -> str:
+    return "\n\n".join(f"=== ANSWER [{i}] ===\n{answer}" for i, answer in answers)
+
+
+class _ScriptedProvider(LLMProvider):
+    """Провайдер LLM, возвращающий ответы по очереди."""
+
+    def __init__(self, responses: List[str]):
+        self.responses = list(responses)
+        self.prompts: List[str] = []
+
+    def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.3,
+        max_tokens: int = 4000,
+        **kwargs
+    ) -> str:
+        self.prompts.append(prompt)
+        return self.responses.pop(0)
+
+    def generate_structured(self, prompt: str, response_format: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def is_available(self) -> bool:
+        return True
+
+
+class SplitBatchResponseTest(unittest.TestCase):
+    """Разбор ответа LLM на пакетный промпт."""
+
+    def test_round_trip(self) -> None:
+        test_cases = [_test_case(f"TC{i}") for i in range(1, 4)]
+        prompts = PromptBuilder().build_batch_prompt(test_cases)
+
+        for i, test_case in enumerate(test_cases, 1):
+            self.assertIn(f"=== TASK [{i}] ===", prompts["task"])
+            self.assertIn(f"ID: {test_case.id}", prompts["task"])
+
+        response = _batch_response(*((i, _answer_code(tc.id)) for i, tc in enumerate(test_cases, 1)))
+        answers = PromptBuilder.split_batch_response(response)
+
+        self.assertEqual(
+            answers, {i: _answer_code(tc.id) for i, tc in enumerate(test_cases, 1)}
+        )
+
+    def test_missing_delimiter(self) -> None:
+        answers = PromptBuilder.split_batch_response(
+            _batch_response((1, "first"), (3, "third"))
+        )
+        self.assertEqual(answers, {1: "first", 3: "third"})
+
+    def test_text_before_first_delimiter_is_ignored(self) -> None:
+        answers = PromptBuilder.split_batch_response("Вот ответы:\n" + _batch_response((1, "first")))
+        self.assertEqual(answers, {1: "first"})
+
+    def test_extra_delimiter(self) -> None:
+        answers = PromptBuilder.split_batch_response(
+            _batch_response((1, "first"), (2, "second"), (5, "extra"))
+        )
+        self.assertEqual(answers, {1: "first", 2: "second", 5: "extra"})
+
+    def test_duplicate_delimiter_is_dropped(self) -> None:
+        answers = PromptBuilder.split_batch_response(
+            _batch_response((1, "first"), (2, "second"), (2, "again"))
+        )
+        self.assertEqual(answers, {1: "first"})
+
+    def test_no_delimiters(self) -> None:
+        self.assertEqual(PromptBuilder.split_batch_response(_answer_code("TC1")), {})
+
+
+class BatchGenerationTest(unittest.TestCase):
+    """Пакетная генерация с переходом на отдельные запросы."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.output = Path(self._tmp.name)
+        self.config = GenerationConfig(
+            validate_code=False,
+            format_code=False,
+            llm=LLMConfig(max_tokens=8000),
+        )
+        self.test_cases = [_test_case(f"TC{i}") for i in range(1, 4)]
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _generate(self, responses: List[str]):
+        provider = _ScriptedProvider(responses)
+        generator = TestGenerator(
+            config_dict={"logging": {"level": "ERROR"}}, llm_provider=provider
+        )
+        results = generator.generate_tests_batch(
+            self.test_cases,
+            output_path=self.output,
+            generation_config=self.config,
+            batch_prompts=True,
+        )
+        return results, provider
+
+    def test_all_answers_in_one_request(self) -> None:
+        results, provider = self._generate(
+            [_batch_response(*((i, _answer_code(tc.id)) for i, tc in enumerate(self.test_cases, 1)))]
+        )
+
+        self.assertEqual(len(provider.prompts), 1)
+        self.assertTrue(all(result.success for result in results))
+        for test_case in self.test_cases:
+            self.assertTrue((self.output / "tests" / f"test_{test_case.id.lower()}.py").is_file())
+
+    def test_missing_answer_falls_back_to_single_request(self) -> None:
+        results, provider = self._generate(
+            [
+                _batch_response((1, _answer_code("TC1")), (3, _answer_code("TC3"))),
+                _answer_code("TC2"),
+            ]
+        )
+
+        self.assertEqual(len(provider.prompts), 2)
+        self.assertNotIn("=== TASK [", provider.prompts[1])
+        self.assertIn("ID: TC2", provider.prompts[1])
+        self.assertEqual([result.success for result in results], [True, True, True])
+        self.assertEqual([len(result.llm_requests) for result in results], [1, 2, 1])
+        content = (self.output / "tests" / "test_tc2.py").read_text(encoding="utf-8")
+        self.assertIn("class TestTC2", content)
+
+    def test_unformatted_response_falls_back_for_every_test_case(self) -> None:
+        results, provider = self._generate(
+            ["Не удалось выполнить задачи"] + [_answer_code(tc.id) for tc in self.test_cases]
+        )
+
+        self.assertEqual(len(provider.prompts), 4)
+        self.assertTrue(all(result.success for result in results))
+        # Пакетный запрос и собственный запрос каждого тест-кейса
+        self.assertEqual([len(result.llm_requests) for result in results], [2, 2, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Тесты сохранения сгенерированных файлов."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from test_generator.models import GeneratedFile
+from test_generator.output.file_manager import FileManager
+from test_generator.utils.exceptions import OutputError
+
+
+def _file(path: str, content: str) -> GeneratedFile:
+    return GeneratedFile(path=Path(path), content=content, file_type="test")
+
+
+class SaveFilesTest(unittest.TestCase):
+    """FileManager.save_files: перезапись, повторы путей и атомарная запись."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.output = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _listing(self):
+        return sorted(path.relative_to(self.output).as_posix() for path in self.output.rglob("*"))
+
+    def test_saves_files(self) -> None:
+        FileManager.save_files(
+            [_file("tests/test_a.py", "тест"), _file("pages/main_page.py", "page")], self.output
+        )
+        self.assertEqual((self.output / "tests" / "test_a.py").read_text(encoding="utf-8"), "тест")
+        self.assertEqual(self._listing(), ["pages", "pages/main_page.py", "tests", "tests/test_a.py"])
+
+    def test_existing_file_is_kept_without_overwrite(self) -> None:
+        FileManager.save_files([_file("tests/test_a.py", "old")], self.output)
+        with self.assertRaisesRegex(OutputError, "уже существует"):
+            FileManager.save_files([_file("tests/test_a.py", "new")], self.output)
+        self.assertEqual((self.output / "tests" / "test_a.py").read_text(encoding="utf-8"), "old")
+
+    def test_existing_file_is_replaced_with_overwrite(self) -> None:
+        FileManager.save_files([_file("tests/test_a.py", "old")], self.output)
+        FileManager.save_files([_file("tests/test_a.py", "new")], self.output, overwrite=True)
+        self.assertEqual((self.output / "tests" / "test_a.py").read_text(encoding="utf-8"), "new")
+        self.assertEqual(self._listing(), ["tests", "tests/test_a.py"])
+
+    def test_duplicate_target_without_overwrite(self) -> None:
+        files = [_file("tests/t.py", "first"), _file("tests/../tests/t.py", "second")]
+        with self.assertRaises(OutputError) as error:
+            FileManager.save_files(files, self.output)
+        message = str(error.exception)
+        self.assertNotIn("уже существует", message)
+        self.assertIn("tests/t.py", message)
+        self.assertIn("tests/../tests/t.py", message)
+        self.assertEqual(self._listing(), [])
+
+    def test_duplicate_target_with_overwrite_keeps_last(self) -> None:
+        files = [_file("tests/t.py", "first"), _file("tests/../tests/t.py", "second")]
+        FileManager.save_files(files, self.output, overwrite=True)
+        self.assertEqual((self.output / "tests" / "t.py").read_text(encoding="utf-8"), "second")
+
+    def test_failed_write_leaves_no_partial_files(self) -> None:
+        FileManager.save_files([_file("tests/test_a.py", "old")], self.output)
+
+        def fail(fd, data):
+            os.write(fd, data[:1])
+            raise OSError("диск заполнен")
+
+        with mock.patch.object(FileManager, "_write_all", side_effect=fail):
+            with self.assertRaises(OutputError):
+                FileManager.save_files([_file("tests/test_b.py", "new")], self.output)
+            with self.assertRaises(OutputError):
+                FileManager.save_files([_file("tests/test_a.py", "new")], self.output, overwrite=True)
+
+        self.assertEqual(self._listing(), ["tests", "tests/test_a.py"])
+        self.assertEqual((self.output / "tests" / "test_a.py").read_text(encoding="utf-8"), "old")
+
+
+if __name__ == "__main__":
+    unittest.main()
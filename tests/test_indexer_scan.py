@@ -0,0 +1,188 @@
+"""Тесты обхода репозитория индексатором."""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from test_generator.models import RepositoryContext
+from test_generator.repository.indexer import RepositoryIndexer, _index_file_worker
+
+
+class _LocalConnector:
+    """Коннектор к локальной директории."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def get_local_path(self) -> Path:
+        return self.path
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-C", str(root), "-c", "user.email=t@t", "-c", "user.name=t", *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+@unittest.skipIf(shutil.which("git") is None, "git недоступен")
+class ScanRepositoryTest(unittest.TestCase):
+    """Обход репозитория через git ls-files и через os.scandir."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        files = {
+            "tests/conftest.py": "import pytest\n",
+            "tests/ui/test_login.py": "def test_login(): pass\n",
+            "pages/login_page.py": "class LoginPage(BasePage): pass\n",
+            "src/pkg/mod.py": "x = 1\n",
+            "src/pkg/__pycache__/mod.py": "",
+            "node_modules/lib/tests/a.py": "",
+            "build/generated.py": "",
+            "untracked/tests/new_test.py": "",
+            "pytest.ini": "[pytest]\n",
+            ".gitignore": "build/\n",
+            "deleted/conftest.py": "",
+        }
+        for relpath, content in files.items():
+            path = self.root / relpath
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+        _git(self.root, "init", "-q")
+        _git(self.root, "add", "tests", "pages", "src/pkg/mod.py", "pytest.ini", ".gitignore", "deleted")
+        _git(self.root, "commit", "-q", "-m", "init")
+        os.remove(self.root / "deleted" / "conftest.py")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _scan(self, context: RepositoryContext, use_git: bool):
+        indexer = RepositoryIndexer(_LocalConnector(self.root))
+        if use_git:
+            return indexer._scan_repository(self.root, context)
+        with mock.patch.object(RepositoryIndexer, "_git_ls_files", return_value=None):
+            return indexer._scan_repository(self.root, context)
+
+    @staticmethod
+    def _relpaths(candidates):
+        return [relpath for _, relpath, _, _ in candidates]
+
+    def test_git_scan_skips_ignored_files(self) -> None:
+        git_structure, git_candidates = self._scan(RepositoryContext(), use_git=True)
+        _, walk_candidates = self._scan(RepositoryContext(), use_git=False)
+
+        walk_relpaths = self._relpaths(walk_candidates)
+        self.assertIn("build/generated.py", walk_relpaths)
+        self.assertEqual(
+            self._relpaths(git_candidates),
+            [relpath for relpath in walk_relpaths if relpath != "build/generated.py"],
+        )
+        self.assertIn("untracked/tests/new_test.py", self._relpaths(git_candidates))
+        self.assertNotIn(self.root / "deleted" / "conftest.py", git_structure.fixture_files)
+        self.assertIn(self.root / "untracked" / "tests", git_structure.test_directories)
+
+    def test_git_and_walk_modes_match_with_patterns(self) -> None:
+        context = RepositoryContext(
+            include_patterns=["tests/*.py", "**/pages/*.py"],
+            exclude_patterns=["**/ui/**"],
+        )
+        _, git_candidates = self._scan(context, use_git=True)
+        _, walk_candidates = self._scan(context, use_git=False)
+        self.assertEqual(self._relpaths(git_candidates), self._relpaths(walk_candidates))
+
+    def test_unmerged_paths_are_listed_once(self) -> None:
+        conftest = self.root / "tests" / "conftest.py"
+        _git(self.root, "checkout", "-q", "-b", "other")
+        conftest.write_text("import pytest  # other\n", encoding="utf-8")
+        _git(self.root, "commit", "-q", "-am", "other")
+        _git(self.root, "checkout", "-q", "-")
+        conftest.write_text("import pytest  # main\n", encoding="utf-8")
+        _git(self.root, "commit", "-q", "-am", "main")
+        with self.assertRaises(subprocess.CalledProcessError) as conflict:
+            _git(self.root, "merge", "other")
+        self.assertIn(b"CONFLICT", conflict.exception.stdout)
+
+        structure, candidates = self._scan(RepositoryContext(), use_git=True)
+        self.assertEqual(self._relpaths(candidates).count("tests/conftest.py"), 1)
+        self.assertEqual(structure.fixture_files.count(conftest), 1)
+
+    def test_include_patterns_follow_rglob(self) -> None:
+        patterns = ["**/*.py", "*.py", "tests/*.py", "tests/**/*.py", "[!s]*/*.py", "ui/test_?????.py"]
+        walk_files = [
+            path.relative_to(self.root).as_posix()
+            for path in self.root.rglob("*")
+            if path.is_file() and ".git" not in path.parts
+        ]
+        for pattern in patterns:
+            with self.subTest(pattern=pattern):
+                expected = {
+                    path.relative_to(self.root).as_posix()
+                    for path in self.root.rglob(pattern)
+                    if path.is_file() and ".git" not in path.parts
+                }
+                include_re = RepositoryIndexer._compile_include_patterns([pattern])
+                self.assertEqual({f for f in walk_files if include_re.match(f)}, expected)
+
+
+@unittest.skipIf(shutil.which("git") is None, "git недоступен")
+class IncrementalIndexTest(unittest.TestCase):
+    """Инкрементальная индексация новой рабочей копии того же репозитория."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        origin = self.tmp / "origin"
+        for relpath, content in {
+            "tests/test_a.py": "def test_a(): pass\n",
+            "tests/test_b.py": "def test_b(): pass\n",
+            "pages/main_page.py": "class MainPage(BasePage): pass\n",
+        }.items():
+            path = origin / relpath
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+        _git(origin, "init", "-q")
+        _git(origin, "add", ".")
+        _git(origin, "commit", "-q", "-m", "init")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _clone(self, name: str, mtime: int) -> Path:
+        path = self.tmp / name
+        _git(self.tmp, "clone", "-q", str(self.tmp / "origin"), str(path))
+        for file in path.rglob("*.py"):
+            os.utime(file, (mtime, mtime))
+        return path
+
+    def _index(self, path: Path, previous=None):
+        indexer = RepositoryIndexer(_LocalConnector(path))
+        with mock.patch(
+            "test_generator.repository.indexer._index_file_worker", wraps=_index_file_worker
+        ) as worker:
+            index = indexer.index(RepositoryContext(), previous_index=previous)
+        read = {Path(call.args[0]).relative_to(path).as_posix() for call in worker.call_args_list}
+        return index, read
+
+    def test_fresh_clone_reuses_files_by_blob_id(self) -> None:
+        first, _ = self._index(self._clone("first", 1_000_000_000))
+
+        second_path = self._clone("second", 2_000_000_000)
+        changed = second_path / "tests" / "test_b.py"
+        changed.write_text("def test_c(): pass\n", encoding="utf-8")
+        second, read = self._index(second_path, previous=first)
+
+        self.assertEqual(read, {"tests/test_b.py"})
+        by_path = {f.path.as_posix(): f for f in second.files}
+        self.assertEqual(by_path["tests/test_b.py"].functions, ["test_c"])
+        self.assertEqual(by_path["tests/test_a.py"].mtime_ns, 2_000_000_000 * 10**9)
+        self.assertIsNone(by_path["tests/test_b.py"].git_blob_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Тесты потокового разбора тест-кейсов."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List
+
+from test_generator.parser import TestCaseParser
+from test_generator.utils.exceptions import TestCaseParseError
+
+
+def _test_case_data(test_case_id: str) -> dict:
+    return {
+        "id": test_case_id,
+        "name": f"Проверка {test_case_id}",
+        "expectedResult": "Страница открыта",
+        "testLayer": "E2E",
+        "steps": [
+            {
+                "id": "1",
+                "name": "Шаг 1",
+                "description": "Открыть страницу",
+                "expectedResult": "Страница открыта",
+            }
+        ],
+    }
+
+
+class ParseStreamTest(unittest.TestCase):
+    """TestCaseParser.parse_stream: массив JSON, NDJSON и многострочный объект."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "test_cases.json"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _logs_error(self):
+        return self.assertLogs("test_generator.parser.json_parser", level="ERROR")
+
+    def _parse(self, text: str) -> List[str]:
+        self.path.write_text(text, encoding="utf-8")
+        return [test_case.id for test_case in TestCaseParser.parse_stream(self.path)]
+
+    def test_json_array(self) -> None:
+        data = [_test_case_data("TC1"), _test_case_data("TC2")]
+        self.assertEqual(self._parse("  \n" + json.dumps(data, indent=2)), ["TC1", "TC2"])
+
+    def test_ndjson(self) -> None:
+        lines = [json.dumps(_test_case_data(f"TC{i}"), ensure_ascii=False) for i in range(1, 4)]
+        self.assertEqual(self._parse("\n".join(lines[:2]) + "\n\n" + lines[2] + "\n"), ["TC1", "TC2", "TC3"])
+
+    def test_multiline_object(self) -> None:
+        text = json.dumps(_test_case_data("TC1"), ensure_ascii=False, indent=4)
+        self.assertEqual(self._parse(text), ["TC1"])
+
+    def test_invalid_data_is_not_treated_as_multiline(self) -> None:
+        data = _test_case_data("TC1")
+        del data["name"]
+        with self.assertRaises(TestCaseParseError) as error, self._logs_error():
+            self._parse(json.dumps(data) + "\n")
+        self.assertIn("строке 1", str(error.exception))
+
+    def test_broken_line_after_valid_lines(self) -> None:
+        text = json.dumps(_test_case_data("TC1")) + "\n{\"id\": \n"
+        with self.assertRaises(TestCaseParseError) as error, self._logs_error():
+            self._parse(text)
+        self.assertIn("строке 2", str(error.exception))
+
+    def test_not_json(self) -> None:
+        with self.assertRaises(TestCaseParseError), self._logs_error():
+            self._parse("id,name\n")
+
+
+if __name__ == "__main__":
+    unittest.main()